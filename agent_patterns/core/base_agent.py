@@ -7,15 +7,46 @@ It defines the core interface and common functionality for agent workflows.
 
 import abc
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, Iterator, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 from langchain_anthropic import ChatAnthropic
+from langchain_core.caches import BaseCache, InMemoryCache
 from langchain_core.language_models.chat_models import BaseChatModel
+from langchain_core.messages import SystemMessage
 from langchain_openai import ChatOpenAI
-from langgraph.graph import StateGraph
 from langgraph.graph.state import CompiledStateGraph
 
+# Chat model instances shared process-wide, keyed on provider class and settings.
+# Agents and roles with identical settings reuse one client and its connection pool.
+_shared_llms: Dict[tuple, BaseChatModel] = {}
+_shared_llms_lock = threading.Lock()
+
+# Response cache used by roles configured with "cache": True. Bounded so a
+# long-running process does not keep every prompt/response pair forever.
+DEFAULT_RESPONSE_CACHE_SIZE = 1000
+_shared_response_cache = InMemoryCache(maxsize=DEFAULT_RESPONSE_CACHE_SIZE)
+
+
+@lru_cache(maxsize=256)
+def _read_prompt_files(prompt_path: str) -> Tuple[str, str]:
+    """Read and strip the system.md and user.md files in a prompt step directory.
+
+    Prompt files are static, so each directory is read from disk once per process.
+    Missing files yield empty strings.
+    """
+    prompts = []
+    for file_name in ("system.md", "user.md"):
+        try:
+            prompts.append((Path(prompt_path) / file_name).read_text(encoding="utf-8").strip())
+        except FileNotFoundError:
+            prompts.append("")
+
+    return prompts[0], prompts[1]
+
 
 class BaseAgent(abc.ABC):
     """
@@ -36,8 +67,8 @@ class BaseAgent(abc.ABC):
         prompt_dir (str): Directory containing prompt templates
         custom_instructions (Optional[str]): Custom instructions appended to all prompts
         prompt_overrides (Dict[str, Dict[str, str]]): Direct prompt overrides by step name
-        graph (Optional[CompiledGraph]): Compiled LangGraph state graph
-        _llm_cache (Dict[str, BaseChatModel]): Cache of initialized LLM instances
+        graph (Optional[CompiledGraph]): Compiled LangGraph state graph, built on first access
+        _llm_cache (Dict[str, BaseChatModel]): Cache of initialized LLM instances by role
     """
 
     def __init__(
@@ -72,11 +103,36 @@ class BaseAgent(abc.ABC):
             self.prompt_dir = prompt_dir
         self.custom_instructions = custom_instructions
         self.prompt_overrides = prompt_overrides or {}
-        self.graph: Optional[CompiledStateGraph] = None
+        self._graph: Optional[CompiledStateGraph] = None
+        self._graph_built = False
+        self._graph_lock = threading.RLock()
         self._llm_cache: Dict[str, BaseChatModel] = {}
 
-        # Build the graph after initialization
-        self.build_graph()
+    @property
+    def graph(self) -> Optional[CompiledStateGraph]:
+        """
+        The compiled graph, built by build_graph() the first time it is accessed.
+
+        Deferring compilation keeps agent construction cheap when an agent is
+        created but never run. The build is guarded by a lock, so threads that
+        access the graph concurrently (e.g. batch_run) wait for it to finish.
+        """
+        if not self._graph_built:
+            with self._graph_lock:
+                if not self._graph_built:
+                    try:
+                        self.build_graph()
+                    except Exception:
+                        self._graph_built = False
+                        raise
+                    self._graph_built = True
+        return self._graph
+
+    @graph.setter
+    def graph(self, value: Optional[CompiledStateGraph]) -> None:
+        with self._graph_lock:
+            self._graph = value
+            self._graph_built = True
 
     @abc.abstractmethod
     def build_graph(self) -> None:
@@ -135,12 +191,39 @@ class BaseAgent(abc.ABC):
         """
         yield self.run(input_data)
 
+    def batch_run(self, tasks: List[Any], max_concurrency: int = 4) -> List[Any]:
+        """
+        Run the agent on several independent inputs concurrently.
+
+        Each input goes through run() on a worker thread, so the LLM and tool
+        round trips of different inputs overlap instead of running back to back.
+        Runs share the agent's LLM instances but no per-run state.
+
+        Args:
+            tasks: The inputs to run
+            max_concurrency: Maximum number of runs in flight at once
+
+        Returns:
+            One entry per input, in order: run()'s result, or the Exception it
+            raised for that input
+        """
+        def run_one(task: Any) -> Any:
+            try:
+                return self.run(task)
+            except Exception as e:
+                return e
+
+        with ThreadPoolExecutor(max_workers=max_concurrency) as executor:
+            return list(executor.map(run_one, tasks))
+
     def _get_llm(self, role: str) -> BaseChatModel:
         """
         Get or create an LLM instance for the specified role.
 
         This method manages LLM initialization and caching. It supports multiple
-        providers (OpenAI, Anthropic) and can be extended for others.
+        providers (OpenAI, Anthropic) and can be extended for others. Roles (and
+        agents) whose provider, model, temperature and max_tokens match share a
+        single instance, so they also share its HTTP client and connection pool.
 
         Args:
             role: The role name (e.g., "thinking", "reflection", "documentation")
@@ -174,27 +257,82 @@ class BaseAgent(abc.ABC):
         temperature = config.get("temperature", 0.7)
         max_tokens = config.get("max_tokens", 2000)
 
-        # Initialize LLM based on provider
-        llm: BaseChatModel
+        # Optional caller-owned httpx.Client, e.g. one HTTP/2 pool shared by all roles
+        http_client = config.get("http_client")
+        if http_client is not None and provider != "openai":
+            raise ValueError(
+                f"'http_client' is only supported for the openai provider (role '{role}')"
+            )
 
-        if provider == "openai":
-            llm = ChatOpenAI(
-                model=model_name, temperature=temperature, max_tokens=max_tokens
+        # Optional response cache: True for the shared in-memory cache, or a BaseCache
+        cache = config.get("cache")
+        if cache is True:
+            cache = _shared_response_cache
+        elif cache is not None and not isinstance(cache, BaseCache):
+            raise ValueError(
+                f"'cache' for role '{role}' must be True or a BaseCache instance"
             )
+
+        # Resolve the provider's chat model class
+        llm_class: type
+        if provider == "openai":
+            llm_class = ChatOpenAI
         elif provider == "anthropic":
-            llm = ChatAnthropic(
-                model=model_name, temperature=temperature, max_tokens=max_tokens
-            )
+            llm_class = ChatAnthropic
         else:
             raise ValueError(
                 f"Unsupported provider '{provider}' for role '{role}'. "
                 f"Supported providers: openai, anthropic"
             )
 
+        # Reuse an instance already created with the same settings. The lock keeps
+        # nodes that fan out over threads from constructing duplicate clients.
+        instance_key = (llm_class, model_name, temperature, max_tokens, http_client, cache)
+        with _shared_llms_lock:
+            llm = _shared_llms.get(instance_key)
+
+            if llm is None:
+                llm_kwargs: Dict[str, Any] = {}
+                if http_client is not None:
+                    llm_kwargs["http_client"] = http_client
+                if cache is not None:
+                    llm_kwargs["cache"] = cache
+                llm = llm_class(
+                    model=model_name, temperature=temperature, max_tokens=max_tokens, **llm_kwargs
+                )
+                _shared_llms[instance_key] = llm
+
         # Cache and return
         self._llm_cache[role] = llm
         return llm
 
+    def _system_message(self, role: str, system_prompt: str) -> SystemMessage:
+        """
+        Build the system message for a call made with the given role's LLM.
+
+        System prompts are static per step, so they form a reusable prompt prefix.
+        For Anthropic roles the prompt is marked with an ephemeral cache_control
+        breakpoint so repeated calls read it from the provider's prompt cache;
+        OpenAI caches long shared prefixes automatically and gets plain text.
+
+        Args:
+            role: The role whose LLM will receive the message
+            system_prompt: The system prompt text
+
+        Returns:
+            A SystemMessage for the prompt
+        """
+        provider = self.llm_configs.get(role, {}).get("provider", "").lower()
+
+        if provider == "anthropic" and system_prompt:
+            return SystemMessage(content=[{
+                "type": "text",
+                "text": system_prompt,
+                "cache_control": {"type": "ephemeral"},
+            }])
+
+        return SystemMessage(content=system_prompt)
+
     def _load_prompt(self, step_name: str) -> Dict[str, str]:
         """
         Load prompt templates for a specific step from the prompts directory.
@@ -229,16 +367,7 @@ class BaseAgent(abc.ABC):
             # Priority 2: Load from file system (existing behavior)
             class_name = self.__class__.__name__
             prompt_path = Path(self.prompt_dir) / class_name / step_name
-
-            # Load system prompt
-            system_file = prompt_path / "system.md"
-            if system_file.exists():
-                system_prompt = system_file.read_text(encoding="utf-8").strip()
-
-            # Load user prompt
-            user_file = prompt_path / "user.md"
-            if user_file.exists():
-                user_prompt = user_file.read_text(encoding="utf-8").strip()
+            system_prompt, user_prompt = _read_prompt_files(str(prompt_path))
 
         # Append custom instructions to system prompt if provided
         if self.custom_instructions and system_prompt:
@@ -246,6 +375,55 @@ class BaseAgent(abc.ABC):
 
         return {"system": system_prompt, "user": user_prompt}
 
+    @classmethod
+    def _invalidate_prompt_cache(cls) -> None:
+        """
+        Drop cached prompt files so the next _load_prompt call re-reads them.
+
+        Useful while editing prompt files in a long-running process.
+        """
+        _read_prompt_files.cache_clear()
+
+    @classmethod
+    def _clear_shared_llms(cls) -> None:
+        """
+        Drop the process-wide chat model instances shared between agents.
+
+        Shared instances hold on to any http_client and cache objects passed in
+        role configs. Clearing releases them; agents that already created an
+        LLM keep their own reference, and new agents create fresh instances.
+        """
+        with _shared_llms_lock:
+            _shared_llms.clear()
+
+    @classmethod
+    def _configure_response_cache(cls, maxsize: Optional[int] = DEFAULT_RESPONSE_CACHE_SIZE) -> None:
+        """
+        Replace the shared response cache used by roles configured with "cache": True.
+
+        The new cache starts empty. Agents created afterwards use it; agents that
+        already created an LLM keep the previous cache.
+
+        Args:
+            maxsize: Maximum number of cached responses, oldest evicted first
+                (None for no limit)
+
+        Raises:
+            ValueError: If maxsize is less than 1
+        """
+        global _shared_response_cache
+
+        if maxsize is not None and maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1, got {maxsize}")
+
+        with _shared_llms_lock:
+            old_cache = _shared_response_cache
+            _shared_response_cache = InMemoryCache(maxsize=maxsize)
+
+            # Shared instances bound to the old cache would otherwise keep it alive
+            for key in [key for key in _shared_llms if key[-1] is old_cache]:
+                del _shared_llms[key]
+
     def on_start(self, input_data: Any) -> None:
         """
         Lifecycle hook called before agent execution starts.
@@ -0,0 +1,135 @@
+"""
+Rule-based text compression for retrieved content.
+
+Retrieved documents often repeat sentences and carry layout noise that costs
+prompt tokens without adding information. This module trims that noise before
+the text is placed into an LLM prompt, and can fit text into a token budget.
+It is purely rule-based: no model calls and no extra dependencies.
+"""
+
+import re
+from typing import List, Tuple
+
+# Supported compression levels, from least to most aggressive
+COMPRESSION_LEVELS = ("none", "low", "medium", "high")
+
+# Common English function words dropped at the "high" level
+_STOPWORDS = frozenset({
+    "a", "an", "the", "and", "or", "but", "of", "to", "in", "on", "at", "by",
+    "for", "with", "as", "is", "are", "was", "were", "be", "been", "being",
+    "that", "this", "these", "those", "it", "its", "which", "very", "really",
+    "just", "also", "then", "there", "such",
+})
+
+_WHITESPACE_RE = re.compile(r"[ \t]+")
+_BLANK_LINES_RE = re.compile(r"\n\s*\n+")
+_SENTENCE_RE = re.compile(r"(?<=[.!?])\s+")
+_WORD_RE = re.compile(r"\w+")
+
+# Rough characters-per-token ratio for English text across common tokenizers
+_CHARS_PER_TOKEN = 4
+
+
+def compress(text: str, level: str = "medium") -> str:
+    """Compress text by removing noise, at the requested aggressiveness.
+
+    Levels:
+        none: Return the text unchanged
+        low: Collapse runs of spaces/tabs and blank lines
+        medium: Also drop repeated sentences (compared case-insensitively)
+        high: Also drop common stopwords from the remaining sentences
+
+    Args:
+        text: The text to compress
+        level: One of COMPRESSION_LEVELS (default: "medium")
+
+    Returns:
+        The compressed text
+
+    Raises:
+        ValueError: If level is not a supported compression level
+    """
+    if level not in COMPRESSION_LEVELS:
+        raise ValueError(
+            f"Unsupported compression level '{level}'. "
+            f"Supported levels: {', '.join(COMPRESSION_LEVELS)}"
+        )
+
+    if level == "none" or not text:
+        return text
+
+    text = _WHITESPACE_RE.sub(" ", text)
+    text = _BLANK_LINES_RE.sub("\n", text).strip()
+
+    if level == "low":
+        return text
+
+    lines: List[str] = []
+    seen = set()
+    for line in text.split("\n"):
+        sentences = []
+        for sentence in _SENTENCE_RE.split(line.strip()):
+            key = " ".join(_WORD_RE.findall(sentence.lower()))
+            if not key or key in seen:
+                continue
+            seen.add(key)
+
+            if level == "high":
+                sentence = " ".join(
+                    word for word in sentence.split(" ")
+                    if word.lower().strip(".,;:!?") not in _STOPWORDS
+                )
+            sentences.append(sentence)
+
+        if sentences:
+            lines.append(" ".join(sentences))
+
+    return "\n".join(lines)
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the number of tokens in text.
+
+    Uses a characters-per-token heuristic, so it works for any provider without
+    loading a tokenizer. Treat the result as approximate.
+
+    Args:
+        text: The text to measure
+
+    Returns:
+        The estimated token count
+    """
+    return -(-len(text) // _CHARS_PER_TOKEN)
+
+
+def fit_to_budget(text: str, max_tokens: int) -> Tuple[str, str]:
+    """Compress text until it fits within an estimated token budget.
+
+    Compression levels are tried from least to most aggressive. If the text is
+    still over budget at "high", trailing lines are dropped, and as a last
+    resort the remaining text is cut to the budget.
+
+    Args:
+        text: The text to fit
+        max_tokens: The token budget
+
+    Returns:
+        Tuple of the fitted text and the step that made it fit: a compression
+        level, or "truncated"
+
+    Raises:
+        ValueError: If max_tokens is less than 1
+    """
+    if max_tokens < 1:
+        raise ValueError(f"max_tokens must be at least 1, got {max_tokens}")
+
+    for level in COMPRESSION_LEVELS:
+        compressed = compress(text, level)
+        if estimate_tokens(compressed) <= max_tokens:
+            return compressed, level
+
+    lines = compressed.split("\n")
+    while len(lines) > 1 and estimate_tokens("\n".join(lines)) > max_tokens:
+        lines.pop()
+
+    return "\n".join(lines)[:max_tokens * _CHARS_PER_TOKEN], "truncated"
@@ -12,7 +12,7 @@ import math
 from typing import Any, Callable, Dict, List, Optional
 
 from langchain_core.language_models.chat_models import BaseChatModel
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import HumanMessage
 from langgraph.graph import StateGraph
 from langgraph.graph.state import CompiledStateGraph
 
@@ -335,7 +335,7 @@ class LATSAgent(BaseAgent):
             )
 
             messages = [
-                SystemMessage(content=system_prompt),
+                self._system_message("thinking", system_prompt),
                 HumanMessage(content=user_prompt)
             ]
 
@@ -496,7 +496,7 @@ class LATSAgent(BaseAgent):
                 )
 
                 messages = [
-                    SystemMessage(content=system_prompt),
+                    self._system_message("evaluation", system_prompt),
                     HumanMessage(content=user_prompt)
                 ]
 
@@ -670,7 +670,7 @@ class LATSAgent(BaseAgent):
             )
 
             messages = [
-                SystemMessage(content=system_prompt),
+                self._system_message("thinking", system_prompt),
                 HumanMessage(content=user_prompt)
             ]
 
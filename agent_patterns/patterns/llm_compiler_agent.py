@@ -7,10 +7,11 @@ graph in an optimized order.
 Reference: https://arxiv.org/abs/2312.04511
 """
 
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Callable, Dict, List, Optional
 
 from langchain_core.language_models.chat_models import BaseChatModel
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import HumanMessage
 from langgraph.graph import StateGraph
 from langgraph.graph.state import CompiledStateGraph
 
@@ -25,13 +26,15 @@ class LLMCompilerAgent(BaseAgent):
 
     Workflow:
         1. Planner: LLM generates an execution graph (DAG) of tool calls
-        2. Executor: Runs nodes in topological order when dependencies are satisfied
+        2. Executor: Runs ready nodes concurrently once their dependencies are satisfied
         3. Check Completion: Determines if all nodes have been executed
         4. Synthesizer: Combines results into final answer
 
     Args:
         llm_configs: Dictionary mapping role names to LLM configuration
         tools: Dictionary mapping tool names to callable functions
+        max_parallel_tools: Maximum number of ready nodes executed at once
+            (default: 4)
         prompt_dir: Directory containing prompt templates (default: "prompts")
 
     Example:
@@ -58,6 +61,7 @@ class LLMCompilerAgent(BaseAgent):
         self,
         llm_configs: Dict[str, Dict[str, Any]],
         tools: Optional[Dict[str, Callable]] = None,
+        max_parallel_tools: int = 4,
         prompt_dir: str = "prompts",
         custom_instructions: Optional[str] = None,
         prompt_overrides: Optional[Dict[str, Dict[str, str]]] = None
@@ -67,11 +71,19 @@ class LLMCompilerAgent(BaseAgent):
         Args:
             llm_configs: Dictionary mapping role names to LLM configuration
             tools: Dictionary mapping tool names to callable functions
+            max_parallel_tools: Maximum number of ready nodes executed at once
             prompt_dir: Directory containing prompt templates
             custom_instructions: Custom instructions appended to all system prompts
             prompt_overrides: Dictionary mapping step names to prompt overrides
+
+        Raises:
+            ValueError: If max_parallel_tools is less than 1
         """
+        if max_parallel_tools < 1:
+            raise ValueError(f"max_parallel_tools must be at least 1, got {max_parallel_tools}")
+
         self.tools = tools or {}
+        self.max_parallel_tools = max_parallel_tools
         super().__init__(
             llm_configs=llm_configs,
             prompt_dir=prompt_dir,
@@ -205,7 +217,7 @@ class LLMCompilerAgent(BaseAgent):
             )
 
             messages = [
-                SystemMessage(content=system_prompt),
+                self._system_message("thinking", system_prompt),
                 HumanMessage(content=user_prompt)
             ]
 
@@ -319,8 +331,9 @@ class LLMCompilerAgent(BaseAgent):
     def _executor_dispatch(self, state: Dict) -> Dict:
         """Execute ready nodes whose dependencies are satisfied.
 
-        Iterates through all nodes in the execution graph and executes any
-        node whose dependencies have all completed.
+        Collects every unexecuted node whose dependencies have all completed
+        and runs their tools concurrently. Nodes that depend on this batch
+        run on the next pass through the executor.
 
         Args:
             state: Current state with execution_graph and node_results
@@ -336,23 +349,23 @@ class LLMCompilerAgent(BaseAgent):
             node_results = state["node_results"]
 
             # Find nodes that can be executed
-            for node in graph["nodes"]:
-                node_id = node["id"]
-
-                # Skip if already executed
-                if node_id in node_results:
-                    continue
-
-                # Check if all dependencies are satisfied
-                dependencies = node.get("depends_on", [])
-                if all(dep in node_results for dep in dependencies):
-                    # Execute this node
-                    result = self._execute_tool(
-                        node["tool"],
-                        node.get("args", {}),
-                        node_results
-                    )
-                    node_results[node_id] = result
+            ready = [
+                node for node in graph["nodes"]
+                if node["id"] not in node_results
+                and all(dep in node_results for dep in node.get("depends_on", []))
+            ]
+
+            def execute(node: Dict[str, Any]) -> Any:
+                return self._execute_tool(node["tool"], node.get("args", {}), node_results)
+
+            if len(ready) > 1:
+                with ThreadPoolExecutor(max_workers=self.max_parallel_tools) as executor:
+                    results = list(executor.map(execute, ready))
+            else:
+                results = [execute(node) for node in ready]
+
+            for node, result in zip(ready, results, strict=True):
+                node_results[node["id"]] = result
 
             state["node_results"] = node_results
 
@@ -433,7 +446,7 @@ class LLMCompilerAgent(BaseAgent):
             )
 
             messages = [
-                SystemMessage(content=system_prompt),
+                self._system_message("documentation", system_prompt),
                 HumanMessage(content=user_prompt)
             ]
 
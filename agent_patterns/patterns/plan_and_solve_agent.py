@@ -7,7 +7,7 @@ The agent first creates a comprehensive plan, then executes each step sequential
 
 from typing import Any, Dict, List, Optional
 
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import HumanMessage
 from langgraph.graph import StateGraph, END
 
 from agent_patterns.core.base_agent import BaseAgent
@@ -172,7 +172,7 @@ class PlanAndSolveAgent(BaseAgent):
 
         # Generate plan
         messages = [
-            SystemMessage(content=system_prompt),
+            self._system_message("planning", system_prompt),
             HumanMessage(content=user_prompt),
         ]
         response = llm.invoke(messages)
@@ -268,7 +268,7 @@ class PlanAndSolveAgent(BaseAgent):
 
         # Generate final answer
         messages = [
-            SystemMessage(content=system_prompt),
+            self._system_message("documentation", system_prompt),
             HumanMessage(content=user_prompt),
         ]
         response = llm.invoke(messages)
@@ -324,7 +324,7 @@ class PlanAndSolveAgent(BaseAgent):
 
         # Execute step
         messages = [
-            SystemMessage(content=system_prompt),
+            self._system_message("execution", system_prompt),
             HumanMessage(content=user_prompt),
         ]
         response = llm.invoke(messages)
@@ -5,13 +5,34 @@ This module implements the ReAct pattern which iteratively reasons about a probl
 and takes actions (tool calls) until arriving at a final answer.
 """
 
+import re
 from typing import Any, Callable, Dict, List, Tuple, Optional
 
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import HumanMessage
 from langgraph.graph import StateGraph, END
 
 from agent_patterns.core.base_agent import BaseAgent
 
+# Section headers in a ReAct response, e.g. "Action Input: ..."
+_SECTION_RE = re.compile(r"(thought|action input|action)\s*:(.*)", re.IGNORECASE)
+
+# Observations come from tools, so generation stops once the LLM starts writing one
+_OBSERVATION_STOP = "\nObservation:"
+
+
+def _unquote_tool_input(tool_input: str) -> str:
+    """Strip one pair of matching quotes the LLM wrapped around a tool input.
+
+    The text inside is kept verbatim: backslashes are not treated as escapes, so
+    paths and regexes reach the tool as written. Inputs that use the quote
+    character inside, e.g. '"a" "b"', are left unchanged.
+    """
+    if len(tool_input) >= 2 and tool_input[0] == tool_input[-1] and tool_input[0] in "\"'":
+        inner = tool_input[1:-1]
+        if tool_input[0] not in inner:
+            return inner
+    return tool_input
+
 
 class ReActAgent(BaseAgent):
     """
@@ -42,6 +63,8 @@ class ReActAgent(BaseAgent):
         llm_configs: Dict[str, Dict[str, Any]],
         tools: Optional[Dict[str, Callable]] = None,
         max_iterations: int = 5,
+        max_history_steps: Optional[int] = None,
+        use_stop_sequence: bool = True,
         prompt_dir: str = "prompts",
         custom_instructions: Optional[str] = None,
         prompt_overrides: Optional[Dict[str, Dict[str, str]]] = None
@@ -53,12 +76,26 @@ class ReActAgent(BaseAgent):
             llm_configs: Configuration for LLM roles
             tools: Dictionary mapping tool names to callable functions
             max_iterations: Maximum number of thought-action cycles
+            max_history_steps: Number of most recent steps shown in full in the
+                prompt; older steps are condensed to one line (None shows all)
+            use_stop_sequence: Stop generation before an "Observation:" line the
+                LLM starts writing itself. Disable for models that reject the
+                stop parameter (e.g. OpenAI o-series reasoning models)
             prompt_dir: Directory containing prompt templates
             custom_instructions: Custom instructions appended to all system prompts
             prompt_overrides: Dictionary mapping step names to prompt overrides
+
+        Raises:
+            ValueError: If max_history_steps is negative
         """
+        if max_history_steps is not None and max_history_steps < 0:
+            raise ValueError(f"max_history_steps must be at least 0, got {max_history_steps}")
+
         self.tools = tools or {}
         self.max_iterations = max_iterations
+        self.max_history_steps = max_history_steps
+        self.use_stop_sequence = use_stop_sequence
+        self._tools_text: Optional[str] = None
         super().__init__(
             llm_configs=llm_configs,
             prompt_dir=prompt_dir,
@@ -166,7 +203,7 @@ class ReActAgent(BaseAgent):
         # Increment iteration counter
         state["iteration_count"] = state.get("iteration_count", 0) + 1
 
-        # Load prompts
+        # Load prompts (prompt files are cached process-wide by BaseAgent)
         prompts = self._load_prompt("ThoughtStep")
         system_prompt = prompts.get("system", "You are a helpful AI assistant.")
         user_prompt_template = prompts.get(
@@ -181,18 +218,24 @@ class ReActAgent(BaseAgent):
         user_prompt = user_prompt_template.format(
             input=state["input"],
             history=history,
-            available_tools=", ".join(self.tools.keys()) if self.tools else "None",
+            available_tools=self._format_tools(),
         )
 
         # Get LLM
         llm = self._get_llm("thinking")
 
-        # Generate response
+        # Generate response. The system prompt is identical on every iteration,
+        # so it stays a cacheable prefix ahead of the per-step user message.
         messages = [
-            SystemMessage(content=system_prompt),
+            self._system_message("thinking", system_prompt),
             HumanMessage(content=user_prompt),
         ]
-        response = llm.invoke(messages)
+        # The parser also ignores invented observations, so the stop sequence
+        # only saves tokens and can be turned off
+        if self.use_stop_sequence:
+            response = llm.invoke(messages, stop=[_OBSERVATION_STOP])
+        else:
+            response = llm.invoke(messages)
         response_text = response.content
 
         # Parse response into thought and action
@@ -323,26 +366,39 @@ class ReActAgent(BaseAgent):
 
         for line in lines:
             line = line.strip()
-            if line.lower().startswith("thought:"):
-                current_section = "thought"
-                thought = line.split(":", 1)[1].strip()
-            elif line.lower().startswith("action:"):
-                current_section = "action"
-                action["tool_name"] = line.split(":", 1)[1].strip()
-            elif line.lower().startswith("action input:"):
-                current_section = "action_input"
-                action["tool_input"] = line.split(":", 1)[1].strip()
+
+            # Anything from an observation on was invented by the LLM, not a tool
+            if line.lower().startswith("observation:"):
+                break
+
+            # Continuation lines rarely contain a colon; skip the regex for them
+            match = _SECTION_RE.match(line) if ":" in line else None
+            if match:
+                current_section = match.group(1).lower().replace(" ", "_")
+                value = match.group(2).strip()
+                if current_section == "thought":
+                    thought = value
+                elif current_section == "action":
+                    action["tool_name"] = value
+                else:
+                    action["tool_input"] = value
             elif current_section == "thought" and line:
                 thought += " " + line
             elif current_section == "action_input" and line:
                 action["tool_input"] += " " + line
 
+        action["tool_input"] = _unquote_tool_input(action["tool_input"])
+
         return thought, action
 
     def _format_history(self, steps: List[Tuple]) -> str:
         """
         Format intermediate steps into a readable history string.
 
+        When max_history_steps is set, only the most recent steps are shown in
+        full; earlier ones are condensed to a single line naming the tools used,
+        so prompt size stays bounded as the loop runs.
+
         Args:
             steps: List of (thought, action, observation) tuples
 
@@ -353,7 +409,15 @@ class ReActAgent(BaseAgent):
             return "No previous steps."
 
         history_lines = []
-        for i, (thought, action, observation) in enumerate(steps, 1):
+        first_shown = 0
+        if self.max_history_steps is not None and len(steps) > self.max_history_steps:
+            first_shown = len(steps) - self.max_history_steps
+            tools_used = ", ".join(
+                dict.fromkeys(action.get("tool_name", "N/A") for _, action, _ in steps[:first_shown])
+            )
+            history_lines.append(f"Steps 1-{first_shown}: (condensed) used {tools_used}")
+
+        for i, (thought, action, observation) in enumerate(steps[first_shown:], first_shown + 1):
             history_lines.append(f"Step {i}:")
             history_lines.append(f"  Thought: {thought}")
             history_lines.append(f"  Action: {action.get('tool_name', 'N/A')}")
@@ -381,6 +445,20 @@ class ReActAgent(BaseAgent):
         else:
             return f"I was unable to find a definitive answer to: {state.get('input', 'the query')}"
 
+    def _format_tools(self) -> str:
+        """
+        Format the available tool names for the prompt.
+
+        The text is rendered once and reused on every iteration; add_tool and
+        remove_tool reset it.
+
+        Returns:
+            Comma-separated tool names, or "None" if there are no tools
+        """
+        if self._tools_text is None:
+            self._tools_text = ", ".join(self.tools.keys()) if self.tools else "None"
+        return self._tools_text
+
     def add_tool(self, name: str, func: Callable) -> None:
         """
         Add a tool to the agent's toolbox.
@@ -390,6 +468,7 @@ class ReActAgent(BaseAgent):
             func: Callable function that takes input and returns output
         """
         self.tools[name] = func
+        self._tools_text = None
 
     def remove_tool(self, name: str) -> None:
         """
@@ -402,6 +481,7 @@ class ReActAgent(BaseAgent):
             KeyError: If the tool doesn't exist
         """
         del self.tools[name]
+        self._tools_text = None
 
     def list_tools(self) -> List[str]:
         """
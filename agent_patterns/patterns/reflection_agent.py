@@ -7,7 +7,7 @@ critiques it, and optionally refines it based on the critique.
 
 from typing import Any, Dict, Optional
 
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import HumanMessage
 from langgraph.graph import StateGraph, END
 
 from agent_patterns.core.base_agent import BaseAgent
@@ -203,7 +203,7 @@ class ReflectionAgent(BaseAgent):
 
         # Generate initial output
         messages = [
-            SystemMessage(content=system_prompt),
+            self._system_message("documentation", system_prompt),
             HumanMessage(content=user_prompt),
         ]
         response = llm.invoke(messages)
@@ -254,7 +254,7 @@ class ReflectionAgent(BaseAgent):
 
         # Generate reflection
         messages = [
-            SystemMessage(content=system_prompt),
+            self._system_message("reflection", system_prompt),
             HumanMessage(content=user_prompt),
         ]
         response = llm.invoke(messages)
@@ -355,7 +355,7 @@ class ReflectionAgent(BaseAgent):
 
         # Generate refined output
         messages = [
-            SystemMessage(content=system_prompt),
+            self._system_message("documentation", system_prompt),
             HumanMessage(content=user_prompt),
         ]
         response = llm.invoke(messages)
@@ -8,7 +8,7 @@ informs subsequent attempts.
 
 from typing import Any, Dict, List, Optional
 
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import HumanMessage
 from langgraph.graph import StateGraph, END
 
 from agent_patterns.core.base_agent import BaseAgent
@@ -204,7 +204,7 @@ class ReflexionAgent(BaseAgent):
 
         # Generate plan
         messages = [
-            SystemMessage(content=system_prompt),
+            self._system_message("thinking", system_prompt),
             HumanMessage(content=user_prompt),
         ]
         response = llm.invoke(messages)
@@ -246,7 +246,7 @@ class ReflexionAgent(BaseAgent):
 
         # Execute
         messages = [
-            SystemMessage(content=system_prompt),
+            self._system_message("execution", system_prompt),
             HumanMessage(content=user_prompt),
         ]
         response = llm.invoke(messages)
@@ -290,7 +290,7 @@ class ReflexionAgent(BaseAgent):
 
         # Evaluate
         messages = [
-            SystemMessage(content=system_prompt),
+            self._system_message("reflection", system_prompt),
             HumanMessage(content=user_prompt),
         ]
         response = llm.invoke(messages)
@@ -346,7 +346,7 @@ class ReflexionAgent(BaseAgent):
 
         # Generate reflection
         messages = [
-            SystemMessage(content=system_prompt),
+            self._system_message("reflection", system_prompt),
             HumanMessage(content=user_prompt),
         ]
         response = llm.invoke(messages)
@@ -451,7 +451,7 @@ class ReflexionAgent(BaseAgent):
 
         # Generate final answer
         messages = [
-            SystemMessage(content=system_prompt),
+            self._system_message("documentation", system_prompt),
             HumanMessage(content=user_prompt),
         ]
         response = llm.invoke(messages)
@@ -7,15 +7,24 @@ integrates the real results. This reduces costs by minimizing expensive LLM call
 Reference: https://arxiv.org/abs/2305.18323
 """
 
-from typing import Any, Callable, Dict, List, Optional
+import copy
+import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 from langchain_core.language_models.chat_models import BaseChatModel
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import HumanMessage
 from langgraph.graph import StateGraph
 from langgraph.graph.state import CompiledStateGraph
 
 from agent_patterns.core.base_agent import BaseAgent
 
+# Field lines in a Worker plan, e.g. "TOOL: search_tool"
+_PLAN_FIELD_RE = re.compile(r"(PLAN|SOLVER|TOOL|PARAMS):(.*)")
+# Matches a {placeholder} reference inside a solver parameter
+_PLACEHOLDER_RE = re.compile(r"\{([^{}]+)\}")
+
 
 class REWOOAgent(BaseAgent):
     """REWOO agent that separates reasoning (Worker) from execution (Solver).
@@ -27,7 +36,7 @@ class REWOOAgent(BaseAgent):
     Workflow:
         1. Worker Plan: LLM creates plan with placeholders for results
         2. Dispatch: Prepare solver requests
-        3. Solver Execute: Run all tools (can be parallelized)
+        3. Solver Execute: Run tools, independent ones concurrently
         4. Collect Results: Gather all solver outputs
         5. Worker Integrate: LLM combines results into final answer
 
@@ -35,6 +44,10 @@ class REWOOAgent(BaseAgent):
         llm_configs: Dictionary mapping role names to LLM configuration
         tools: Dictionary mapping tool names to callable functions
         solver_llm_role: Role name for solver LLM (default: "solver")
+        cache_plans: Reuse the Worker's plan when the same task is run again
+            (default: False)
+        max_parallel_tools: Maximum number of independent solver requests run
+            at once (default: 4)
         prompt_dir: Directory containing prompt templates (default: "prompts")
 
     Example:
@@ -56,6 +69,8 @@ class REWOOAgent(BaseAgent):
         llm_configs: Dict[str, Dict[str, Any]],
         tools: Optional[Dict[str, Callable]] = None,
         solver_llm_role: str = "solver",
+        cache_plans: bool = False,
+        max_parallel_tools: int = 4,
         prompt_dir: str = "prompts",
         custom_instructions: Optional[str] = None,
         prompt_overrides: Optional[Dict[str, Dict[str, str]]] = None
@@ -66,12 +81,23 @@ class REWOOAgent(BaseAgent):
             llm_configs: Dictionary mapping role names to LLM configuration
             tools: Dictionary mapping tool names to callable functions
             solver_llm_role: Role name for solver LLM
+            cache_plans: Reuse plans for repeated tasks instead of re-planning
+            max_parallel_tools: Maximum number of solver requests run at once
             prompt_dir: Directory containing prompt templates
             custom_instructions: Custom instructions appended to all system prompts
             prompt_overrides: Dictionary mapping step names to prompt overrides
+
+        Raises:
+            ValueError: If max_parallel_tools is less than 1
         """
+        if max_parallel_tools < 1:
+            raise ValueError(f"max_parallel_tools must be at least 1, got {max_parallel_tools}")
+
         self.tools = tools or {}
         self.solver_llm_role = solver_llm_role
+        self.cache_plans = cache_plans
+        self.max_parallel_tools = max_parallel_tools
+        self._plan_cache: Dict[str, Tuple[str, List[Dict[str, Any]]]] = {}
         super().__init__(
             llm_configs=llm_configs,
             prompt_dir=prompt_dir,
@@ -152,7 +178,9 @@ class REWOOAgent(BaseAgent):
 
         The Worker (expensive LLM) analyzes the task and creates a plan
         describing what needs to be done, using placeholders like {result1}
-        for solver outputs it hasn't seen yet.
+        for solver outputs it hasn't seen yet. With cache_plans enabled, a task
+        seen before (ignoring case and whitespace) reuses its earlier plan
+        without calling the Worker.
 
         Args:
             state: Current state containing input_task
@@ -161,6 +189,13 @@ class REWOOAgent(BaseAgent):
             Updated state with worker_plan_template and solver_requests
         """
         try:
+            cache_key = " ".join(str(state["input_task"]).lower().split())
+            if self.cache_plans and cache_key in self._plan_cache:
+                plan_template, solver_requests = self._plan_cache[cache_key]
+                state["worker_plan_template"] = plan_template
+                state["solver_requests"] = copy.deepcopy(solver_requests)
+                return state
+
             prompt_data = self._load_prompt("WorkerPlan")
             worker_llm: BaseChatModel = self._get_llm("thinking")
 
@@ -175,7 +210,7 @@ class REWOOAgent(BaseAgent):
             )
 
             messages = [
-                SystemMessage(content=system_prompt),
+                self._system_message("thinking", system_prompt),
                 HumanMessage(content=user_prompt)
             ]
 
@@ -184,7 +219,15 @@ class REWOOAgent(BaseAgent):
             plan_text = response.content
 
             # Parse the plan into template and solver requests
-            plan_template, solver_requests = self._parse_worker_plan(plan_text)
+            plan_template, solver_requests = self._parse_plan_fields(plan_text)
+
+            # Only cache plans the Worker actually wrote, not the fallback plan
+            if self.cache_plans and plan_template and solver_requests:
+                self._plan_cache[cache_key] = (plan_template, copy.deepcopy(solver_requests))
+
+            plan_template, solver_requests = self._apply_plan_fallbacks(
+                plan_text, plan_template, solver_requests
+            )
 
             state["worker_plan_template"] = plan_template
             state["solver_requests"] = solver_requests
@@ -233,6 +276,19 @@ class REWOOAgent(BaseAgent):
         Returns:
             Tuple of (plan_template, solver_requests)
         """
+        plan_template, solver_requests = self._parse_plan_fields(plan_text)
+        return self._apply_plan_fallbacks(plan_text, plan_template, solver_requests)
+
+    def _parse_plan_fields(self, plan_text: str) -> Tuple[str, List[Dict[str, Any]]]:
+        """Extract the PLAN line and SOLVER blocks from the Worker's plan text.
+
+        Args:
+            plan_text: The plan generated by Worker LLM
+
+        Returns:
+            Tuple of (plan_template, solver_requests); either is empty when the
+            text does not contain it
+        """
         lines = plan_text.strip().split("\n")
         plan_template = ""
         solver_requests = []
@@ -246,29 +302,51 @@ class REWOOAgent(BaseAgent):
                     current_solver = {}
                 continue
 
-            if line.startswith("PLAN:"):
-                plan_template = line.split(":", 1)[1].strip()
+            match = _PLAN_FIELD_RE.match(line)
+            if not match:
+                continue
+
+            field, value = match.group(1), match.group(2).strip()
 
-            elif line.startswith("SOLVER:"):
+            if field == "PLAN":
+                plan_template = value
+
+            elif field == "SOLVER":
                 if current_solver and "placeholder" in current_solver:
                     solver_requests.append(current_solver)
-                current_solver = {"placeholder": line.split(":", 1)[1].strip()}
+                current_solver = {"placeholder": value}
 
-            elif line.startswith("TOOL:"):
-                current_solver["tool"] = line.split(":", 1)[1].strip()
+            elif field == "TOOL":
+                current_solver["tool"] = value
 
-            elif line.startswith("PARAMS:"):
-                params_str = line.split(":", 1)[1].strip()
+            else:
                 try:
-                    import json
-                    current_solver["params"] = json.loads(params_str)
-                except:
-                    current_solver["params"] = {"raw": params_str}
+                    current_solver["params"] = json.loads(value)
+                except ValueError:
+                    current_solver["params"] = {"raw": value}
 
         # Add last solver if exists
         if current_solver and "placeholder" in current_solver:
             solver_requests.append(current_solver)
 
+        return plan_template, solver_requests
+
+    def _apply_plan_fallbacks(
+        self,
+        plan_text: str,
+        plan_template: str,
+        solver_requests: List[Dict[str, Any]]
+    ) -> Tuple[str, List[Dict[str, Any]]]:
+        """Fill in a default template and solver request when parsing found none.
+
+        Args:
+            plan_text: The plan generated by Worker LLM
+            plan_template: Parsed plan template, possibly empty
+            solver_requests: Parsed solver requests, possibly empty
+
+        Returns:
+            Tuple of (plan_template, solver_requests)
+        """
         # Fallback if parsing failed
         if not plan_template:
             plan_template = "Execute task: " + plan_text[:100]
@@ -316,8 +394,11 @@ class REWOOAgent(BaseAgent):
     def _solver_execute(self, state: Dict) -> Dict:
         """Execute all solver requests using tools or solver LLM.
 
-        The Solver can be a cheaper LLM or direct tool calls. This step
-        runs all the planned operations and stores results.
+        The Solver can be a cheaper LLM or direct tool calls. Requests run in
+        waves: every request whose {placeholder} dependencies are already
+        resolved runs concurrently, then the next wave starts with those
+        results available. Requests with the same tool and resolved params
+        are executed once and share the result.
 
         Args:
             state: Current state with solver_requests
@@ -331,21 +412,46 @@ class REWOOAgent(BaseAgent):
         try:
             solver_requests = state["solver_requests"]
             solver_results = state["solver_results"]
-
-            # Execute each solver request
-            for req in solver_requests:
-                placeholder = req["placeholder"]
-                tool_name = req["tool"]
-                params = req.get("params", {})
-
-                # Resolve any placeholders in params
-                resolved_params = self._resolve_params(params, solver_results)
-
-                # Execute the tool
-                result = self._call_solver(tool_name, resolved_params)
-
-                # Store result
-                solver_results[placeholder] = result
+            placeholders = {req["placeholder"] for req in solver_requests}
+            pending = list(solver_requests)
+            call_results: Dict[str, Any] = {}
+
+            with ThreadPoolExecutor(max_workers=self.max_parallel_tools) as executor:
+                while pending:
+                    wave = [
+                        req for req in pending
+                        if not (self._dependencies(req, placeholders) - solver_results.keys())
+                    ]
+                    if not wave:
+                        # Circular references: run the next request in plan order
+                        wave = pending[:1]
+
+                    # Resolve params before submitting so workers never read
+                    # solver_results while it is being updated
+                    resolved = [
+                        self._resolve_params(req.get("params", {}), solver_results)
+                        for req in wave
+                    ]
+                    keys = [
+                        self._call_key(req["tool"], params)
+                        for req, params in zip(wave, resolved, strict=True)
+                    ]
+
+                    # Identical calls run once per run and share their result
+                    new_calls: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+                    for req, params, key in zip(wave, resolved, keys, strict=True):
+                        if key not in call_results:
+                            new_calls.setdefault(key, (req["tool"], params))
+                    call_results.update(zip(
+                        new_calls,
+                        executor.map(lambda call: self._call_solver(*call), new_calls.values()),
+                        strict=True
+                    ))
+
+                    for req, key in zip(wave, keys, strict=True):
+                        solver_results[req["placeholder"]] = call_results[key]
+                    done = {id(req) for req in wave}
+                    pending = [req for req in pending if id(req) not in done]
 
             state["solver_results"] = solver_results
 
@@ -354,6 +460,34 @@ class REWOOAgent(BaseAgent):
 
         return state
 
+    def _call_key(self, tool_name: str, params: Dict[str, Any]) -> str:
+        """Build the key used to detect identical solver calls.
+
+        Args:
+            tool_name: Name of the tool
+            params: Resolved parameters for the tool
+
+        Returns:
+            Key that is equal for calls with the same tool and params
+        """
+        return f"{tool_name}:{json.dumps(params, sort_keys=True, default=str)}"
+
+    def _dependencies(self, req: Dict[str, Any], placeholders: set) -> set:
+        """Return the other requests' placeholders referenced in a request's params.
+
+        Args:
+            req: Solver request
+            placeholders: Placeholders produced by all solver requests
+
+        Returns:
+            Set of placeholders this request must wait for
+        """
+        referenced = set()
+        for value in req.get("params", {}).values():
+            if isinstance(value, str):
+                referenced.update(_PLACEHOLDER_RE.findall(value))
+        return (referenced & placeholders) - {req["placeholder"]}
+
     def _resolve_params(
         self,
         params: Dict[str, Any],
@@ -375,18 +509,34 @@ class REWOOAgent(BaseAgent):
 
         for key, value in params.items():
             if isinstance(value, str):
-                # Replace all {placeholder} patterns
-                resolved_value = value
-                for placeholder, result in solver_results.items():
-                    pattern = f"{{{placeholder}}}"
-                    if pattern in resolved_value:
-                        resolved_value = resolved_value.replace(pattern, str(result))
-                resolved[key] = resolved_value
+                resolved[key] = self._fill_placeholders(value, solver_results)
             else:
                 resolved[key] = value
 
         return resolved
 
+    def _fill_placeholders(self, text: str, solver_results: Dict[str, Any]) -> str:
+        """Replace {placeholder} references in text with solver results.
+
+        Substitution is a single regex pass over the text, so the cost does
+        not grow with the number of results. Unknown placeholders are left
+        as they are.
+
+        Args:
+            text: Text that may contain {placeholder} references
+            solver_results: Results from executed solvers
+
+        Returns:
+            Text with known placeholders replaced
+        """
+        def substitute(match: re.Match[str]) -> str:
+            placeholder = match.group(1)
+            if placeholder in solver_results:
+                return str(solver_results[placeholder])
+            return match.group(0)
+
+        return _PLACEHOLDER_RE.sub(substitute, text)
+
     def _call_solver(self, tool_name: str, params: Dict[str, Any]) -> Any:
         """Execute a single solver request.
 
@@ -427,8 +577,8 @@ class REWOOAgent(BaseAgent):
     def _collect_solver_results(self, state: Dict) -> Dict:
         """Collect and validate all solver results.
 
-        In parallel implementations, this would wait for all solvers to complete.
-        For now, results are already collected synchronously.
+        Solver execution waits for every wave to finish, so all results are
+        already present when this step runs.
 
         Args:
             state: Current state with solver_results
@@ -478,10 +628,7 @@ class REWOOAgent(BaseAgent):
             plan_template = state["worker_plan_template"]
             solver_results = state["solver_results"]
 
-            filled_plan = plan_template
-            for placeholder, result in solver_results.items():
-                pattern = f"{{{placeholder}}}"
-                filled_plan = filled_plan.replace(pattern, str(result))
+            filled_plan = self._fill_placeholders(plan_template, solver_results)
 
             # Build messages for integration
             system_prompt = prompt_data["system"]
@@ -492,7 +639,7 @@ class REWOOAgent(BaseAgent):
             )
 
             messages = [
-                SystemMessage(content=system_prompt),
+                self._system_message("thinking", system_prompt),
                 HumanMessage(content=user_prompt)
             ]
 
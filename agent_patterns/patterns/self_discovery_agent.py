@@ -11,7 +11,7 @@ Reference: https://arxiv.org/abs/2402.03620
 from typing import Any, Dict, List, Optional
 
 from langchain_core.language_models.chat_models import BaseChatModel
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import HumanMessage
 from langgraph.graph import StateGraph
 from langgraph.graph.state import CompiledStateGraph
 
@@ -247,7 +247,7 @@ class SelfDiscoveryAgent(BaseAgent):
             )
 
             messages = [
-                SystemMessage(content=system_prompt),
+                self._system_message("thinking", system_prompt),
                 HumanMessage(content=user_prompt)
             ]
 
@@ -350,7 +350,7 @@ class SelfDiscoveryAgent(BaseAgent):
                 )
 
                 messages = [
-                    SystemMessage(content=system_prompt),
+                    self._system_message("thinking", system_prompt),
                     HumanMessage(content=user_prompt)
                 ]
 
@@ -399,7 +399,7 @@ class SelfDiscoveryAgent(BaseAgent):
             )
 
             messages = [
-                SystemMessage(content=system_prompt),
+                self._system_message("thinking", system_prompt),
                 HumanMessage(content=user_prompt)
             ]
 
@@ -501,7 +501,7 @@ class SelfDiscoveryAgent(BaseAgent):
             )
 
             messages = [
-                SystemMessage(content=system_prompt),
+                self._system_message("execution", system_prompt),
                 HumanMessage(content=user_prompt)
             ]
 
@@ -579,7 +579,7 @@ class SelfDiscoveryAgent(BaseAgent):
             )
 
             messages = [
-                SystemMessage(content=system_prompt),
+                self._system_message("thinking", system_prompt),
                 HumanMessage(content=user_prompt)
             ]
 
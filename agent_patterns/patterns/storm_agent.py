@@ -9,14 +9,17 @@ The STORM pattern creates comprehensive, multi-perspective articles or reports b
 Reference: https://arxiv.org/abs/2402.14207
 """
 
-from typing import Any, Callable, Dict, List, Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple, cast
 
+from langchain_core.language_models import LanguageModelInput
 from langchain_core.language_models.chat_models import BaseChatModel
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import HumanMessage
 from langgraph.graph import StateGraph
 from langgraph.graph.state import CompiledStateGraph
 
 from agent_patterns.core.base_agent import BaseAgent
+from agent_patterns.core.compression import COMPRESSION_LEVELS, compress, fit_to_budget
 
 
 # Default perspectives for multi-viewpoint questioning
@@ -47,6 +50,13 @@ class STORMAgent(BaseAgent):
         llm_configs: Dictionary mapping role names to LLM configuration
         retrieval_tools: Dictionary mapping tool names to callable functions
         perspectives: Custom perspective definitions (optional)
+        max_concurrency: Maximum number of independent LLM calls issued at once (default: 4)
+        compression_level: How aggressively to compress retrieved text before it
+            enters prompts: "none", "low", "medium" or "high" (default: "none")
+        fast_llm_role: Role for the high-volume perspective and question steps;
+            falls back to "thinking" when not configured (default: "fast")
+        max_synthesis_tokens: Estimated token budget for the research passed to
+            each section synthesis call; None disables the gate (default: None)
         prompt_dir: Directory containing prompt templates (default: "prompts")
 
     Example:
@@ -68,6 +78,10 @@ class STORMAgent(BaseAgent):
         llm_configs: Dict[str, Dict[str, Any]],
         retrieval_tools: Optional[Dict[str, Callable]] = None,
         perspectives: Optional[List[Dict[str, str]]] = None,
+        max_concurrency: int = 4,
+        compression_level: str = "none",
+        fast_llm_role: str = "fast",
+        max_synthesis_tokens: Optional[int] = None,
         prompt_dir: str = "prompts",
         custom_instructions: Optional[str] = None,
         prompt_overrides: Optional[Dict[str, Dict[str, str]]] = None
@@ -78,12 +92,38 @@ class STORMAgent(BaseAgent):
             llm_configs: Dictionary mapping role names to LLM configuration
             retrieval_tools: Dictionary mapping tool names to retrieval functions
             perspectives: Custom perspective definitions
+            max_concurrency: Maximum number of independent LLM calls issued at once
+            compression_level: Compression applied to retrieved text (see compress())
+            fast_llm_role: Role for perspective selection and question generation
+            max_synthesis_tokens: Token budget for each section's research
             prompt_dir: Directory containing prompt templates
             custom_instructions: Custom instructions appended to all system prompts
             prompt_overrides: Dictionary mapping step names to prompt overrides
+
+        Raises:
+            ValueError: If max_concurrency or max_synthesis_tokens is less than 1,
+                or compression_level is not supported
         """
+        if max_concurrency < 1:
+            raise ValueError(f"max_concurrency must be at least 1, got {max_concurrency}")
+
+        if max_synthesis_tokens is not None and max_synthesis_tokens < 1:
+            raise ValueError(
+                f"max_synthesis_tokens must be at least 1, got {max_synthesis_tokens}"
+            )
+
+        if compression_level not in COMPRESSION_LEVELS:
+            raise ValueError(
+                f"Unsupported compression level '{compression_level}'. "
+                f"Supported levels: {', '.join(COMPRESSION_LEVELS)}"
+            )
+
         self.retrieval_tools = retrieval_tools or {}
         self.perspectives = perspectives or DEFAULT_PERSPECTIVES
+        self.max_concurrency = max_concurrency
+        self.compression_level = compression_level
+        self.fast_llm_role = fast_llm_role
+        self.max_synthesis_tokens = max_synthesis_tokens
         super().__init__(
             llm_configs=llm_configs,
             prompt_dir=prompt_dir,
@@ -154,19 +194,7 @@ class STORMAgent(BaseAgent):
         self.on_start(input_data)
 
         try:
-            state = {
-                "topic": input_data,
-                "outline": {},
-                "active_perspectives": [],
-                "questions": {},
-                "queries": [],
-                "search_results": {},
-                "synthesized_sections": {},
-                "final_report": None,
-                "error": None
-            }
-
-            final_state = self.graph.invoke(state)
+            final_state = self.graph.invoke(self._initial_state(input_data))
 
             if final_state.get("error"):
                 raise Exception(final_state["error"])
@@ -179,6 +207,129 @@ class STORMAgent(BaseAgent):
             self.on_error(e)
             raise
 
+    def batch_run(self, tasks: List[Any], max_concurrency: Optional[int] = None) -> List[Any]:
+        """Execute the STORM workflow for several topics concurrently.
+
+        Each topic runs through the full graph; up to max_concurrency topics are
+        in flight at once, so their LLM and retrieval calls overlap instead of
+        running one report after another.
+
+        Args:
+            tasks: The topics to write reports on
+            max_concurrency: Maximum number of topics in flight at once
+                (default: the agent's max_concurrency)
+
+        Returns:
+            One entry per task, in order: the final report, or the Exception
+            raised for that task if its workflow failed
+        """
+        for task in tasks:
+            self.on_start(task)
+
+        final_states = self.graph.batch(
+            [self._initial_state(task) for task in tasks],
+            config={"max_concurrency": max_concurrency or self.max_concurrency},
+            return_exceptions=True
+        )
+
+        results: List[Any] = []
+        for final_state in final_states:
+            if isinstance(final_state, Exception):
+                error = final_state
+            elif final_state.get("error"):
+                error = Exception(final_state["error"])
+            else:
+                result = final_state["final_report"]
+                self.on_finish(result)
+                results.append(result)
+                continue
+
+            self.on_error(error)
+            results.append(error)
+
+        return results
+
+    def stream(self, input_data: Any) -> Iterator[str]:
+        """Execute the STORM workflow, yielding the final report as it is written.
+
+        Planning, retrieval and synthesis run as in run(); the report is then
+        yielded chunk by chunk while the compilation LLM generates it, so callers
+        can forward text to a terminal or file without buffering the whole report.
+
+        Args:
+            input_data: The topic for the report
+
+        Yields:
+            Chunks of the final report text
+
+        Raises:
+            Exception: If graph execution or report compilation fails
+        """
+        self.on_start(input_data)
+
+        try:
+            final_state: Dict = {}
+            streamed = False
+
+            # With a list of stream modes, LangGraph yields (mode, chunk) pairs
+            events = cast(Iterator[Tuple[str, Any]], self.graph.stream(
+                self._initial_state(input_data),
+                stream_mode=["messages", "values"]
+            ))
+
+            for mode, chunk in events:
+                if mode == "values":
+                    final_state = chunk
+                    continue
+
+                message, metadata = chunk
+                if metadata.get("langgraph_node") == "compile_report" and message.text:
+                    streamed = True
+                    yield message.text
+
+            if final_state.get("error"):
+                raise Exception(final_state["error"])
+
+            # Compilation can fail after part of the report was yielded, so the
+            # error is raised rather than ending the stream on truncated text
+            if final_state.get("compile_error"):
+                raise Exception(final_state["final_report"])
+
+            result = final_state["final_report"]
+
+            # Nothing was streamed (the model returned the report in one piece)
+            if not streamed:
+                yield result
+
+            self.on_finish(result)
+
+        except Exception as e:
+            self.on_error(e)
+            raise
+
+    def _initial_state(self, topic: Any) -> Dict:
+        """Build the initial graph state for a topic.
+
+        Args:
+            topic: The topic for the report
+
+        Returns:
+            Initial state dictionary
+        """
+        return {
+            "topic": topic,
+            "outline": {},
+            "active_perspectives": [],
+            "questions": {},
+            "queries": [],
+            "search_results": {},
+            "synthesized_sections": {},
+            "synthesis_compression": {},
+            "final_report": None,
+            "compile_error": None,
+            "error": None
+        }
+
     def _generate_outline(self, state: Dict) -> Dict:
         """Generate hierarchical outline for the topic.
 
@@ -202,7 +353,7 @@ class STORMAgent(BaseAgent):
             user_prompt = prompt_data["user"].format(topic=state["topic"])
 
             messages = [
-                SystemMessage(content=system_prompt),
+                self._system_message("thinking", system_prompt),
                 HumanMessage(content=user_prompt)
             ]
 
@@ -278,7 +429,8 @@ class STORMAgent(BaseAgent):
 
         try:
             prompt_data = self._load_prompt("GeneratePerspectives")
-            perspective_llm: BaseChatModel = self._get_llm("thinking")
+            role = self._question_role()
+            perspective_llm: BaseChatModel = self._get_llm(role)
 
             # Format available perspectives
             perspectives_text = self._format_perspectives()
@@ -291,7 +443,7 @@ class STORMAgent(BaseAgent):
             )
 
             messages = [
-                SystemMessage(content=system_prompt),
+                self._system_message(role, system_prompt),
                 HumanMessage(content=user_prompt)
             ]
 
@@ -308,6 +460,19 @@ class STORMAgent(BaseAgent):
 
         return state
 
+    def _question_role(self) -> str:
+        """Pick the LLM role for perspective selection and question generation.
+
+        These steps issue many short calls, so a cheaper model can be configured
+        for them under fast_llm_role; otherwise the "thinking" model is used.
+
+        Returns:
+            The role name to use
+        """
+        if self.fast_llm_role in self.llm_configs:
+            return self.fast_llm_role
+        return "thinking"
+
     def _format_perspectives(self) -> str:
         """Format perspective options for prompt.
 
@@ -346,6 +511,9 @@ class STORMAgent(BaseAgent):
     def _generate_questions(self, state: Dict) -> Dict:
         """Generate questions for each section from each perspective.
 
+        Every (section, perspective) prompt is independent, so they are sent
+        as one batch and run concurrently up to max_concurrency.
+
         Args:
             state: Current state with outline and perspectives
 
@@ -357,9 +525,12 @@ class STORMAgent(BaseAgent):
 
         try:
             prompt_data = self._load_prompt("GenerateQuestions")
-            question_llm: BaseChatModel = self._get_llm("thinking")
+            role = self._question_role()
+            question_llm: BaseChatModel = self._get_llm(role)
 
             questions = {}
+            targets = []
+            batch_messages: List[LanguageModelInput] = []
 
             # For each section
             for section, subsections in state["outline"].items():
@@ -377,18 +548,21 @@ class STORMAgent(BaseAgent):
                         perspective_description=perspective["description"]
                     )
 
-                    messages = [
-                        SystemMessage(content=system_prompt),
+                    targets.append((section, perspective["name"]))
+                    batch_messages.append([
+                        self._system_message(role, system_prompt),
                         HumanMessage(content=user_prompt)
-                    ]
+                    ])
 
-                    # Get questions
-                    response = question_llm.invoke(messages)
-                    question_text = response.content
+            # Get questions for all section/perspective pairs concurrently
+            responses = question_llm.batch(
+                batch_messages,
+                config={"max_concurrency": self.max_concurrency}
+            )
 
-                    # Parse questions
-                    q_list = self._parse_questions(question_text)
-                    questions[section][perspective["name"]] = q_list
+            # Parse questions
+            for (section, perspective_name), response in zip(targets, responses, strict=True):
+                questions[section][perspective_name] = self._parse_questions(response.content)
 
             state["questions"] = questions
 
@@ -451,6 +625,11 @@ class STORMAgent(BaseAgent):
     def _execute_search(self, state: Dict) -> Dict:
         """Execute retrieval for all queries.
 
+        Retrieval tools are typically I/O-bound and queries are independent,
+        so they run on a thread pool of up to max_concurrency workers. Questions
+        that match after lowercasing and whitespace normalization (common across
+        perspectives) are retrieved once and share the result.
+
         Args:
             state: Current state with queries
 
@@ -462,14 +641,27 @@ class STORMAgent(BaseAgent):
 
         try:
             results = {}
+            queries = state["queries"]
+
+            # Keep the first phrasing of each distinct question
+            distinct_questions: Dict[str, str] = {}
+            for query_item in queries:
+                question = query_item["question"]
+                distinct_questions.setdefault(self._normalize_query(question), question)
+
+            # Execute retrieval
+            with ThreadPoolExecutor(max_workers=self.max_concurrency) as executor:
+                retrieved_by_key = dict(zip(
+                    distinct_questions,
+                    executor.map(self._retrieve_information, distinct_questions.values()),
+                    strict=True
+                ))
 
-            for query_item in state["queries"]:
+            for query_item in queries:
                 section = query_item["section"]
                 perspective = query_item["perspective"]
                 question = query_item["question"]
-
-                # Execute retrieval
-                retrieved = self._retrieve_information(question)
+                retrieved = retrieved_by_key[self._normalize_query(question)]
 
                 # Store results
                 if section not in results:
@@ -489,9 +681,23 @@ class STORMAgent(BaseAgent):
 
         return state
 
+    def _normalize_query(self, query: str) -> str:
+        """Normalize a query for duplicate detection.
+
+        Args:
+            query: Search query
+
+        Returns:
+            The query lowercased with whitespace collapsed
+        """
+        return " ".join(query.lower().split())
+
     def _retrieve_information(self, query: str) -> str:
         """Retrieve information for a query.
 
+        Tool output is compressed according to compression_level before it is
+        passed on to the synthesis prompts.
+
         Args:
             query: Search query
 
@@ -501,7 +707,8 @@ class STORMAgent(BaseAgent):
         # Try to use retrieval tools
         if "search" in self.retrieval_tools:
             try:
-                return self.retrieval_tools["search"](query)
+                retrieved = self.retrieval_tools["search"](query)
+                return compress(str(retrieved), self.compression_level)
             except:
                 pass
 
@@ -523,6 +730,12 @@ class STORMAgent(BaseAgent):
     def _synthesize_sections(self, state: Dict) -> Dict:
         """Synthesize content for each section from all perspectives.
 
+        Sections are written independently of one another, so all synthesis
+        prompts are sent as one batch and run concurrently up to max_concurrency.
+        When max_synthesis_tokens is set, each section's research is compressed
+        until it fits the budget, and the step that made it fit is recorded in
+        synthesis_compression.
+
         Args:
             state: Current state with search_results
 
@@ -536,7 +749,8 @@ class STORMAgent(BaseAgent):
             prompt_data = self._load_prompt("SynthesizeSection")
             synthesis_llm: BaseChatModel = self._get_llm("documentation")
 
-            synthesized = {}
+            sections = []
+            batch_messages: List[LanguageModelInput] = []
 
             for section, perspective_results in state["search_results"].items():
                 # Gather all information for this section
@@ -547,6 +761,11 @@ class STORMAgent(BaseAgent):
 
                 combined_info = "\n".join(all_info)
 
+                # Keep the research within the synthesis token budget
+                if self.max_synthesis_tokens is not None:
+                    combined_info, step = fit_to_budget(combined_info, self.max_synthesis_tokens)
+                    state.setdefault("synthesis_compression", {})[section] = step
+
                 # Build messages
                 system_prompt = prompt_data["system"]
                 user_prompt = prompt_data["user"].format(
@@ -555,16 +774,22 @@ class STORMAgent(BaseAgent):
                     information=combined_info
                 )
 
-                messages = [
-                    SystemMessage(content=system_prompt),
+                sections.append(section)
+                batch_messages.append([
+                    self._system_message("documentation", system_prompt),
                     HumanMessage(content=user_prompt)
-                ]
+                ])
 
-                # Synthesize section
-                response = synthesis_llm.invoke(messages)
-                synthesized[section] = response.content
+            # Synthesize all sections concurrently
+            responses = synthesis_llm.batch(
+                batch_messages,
+                config={"max_concurrency": self.max_concurrency}
+            )
 
-            state["synthesized_sections"] = synthesized
+            state["synthesized_sections"] = {
+                section: response.content
+                for section, response in zip(sections, responses, strict=True)
+            }
 
         except Exception as e:
             state["error"] = f"Section synthesis error: {str(e)}"
@@ -603,7 +828,7 @@ class STORMAgent(BaseAgent):
             )
 
             messages = [
-                SystemMessage(content=system_prompt),
+                self._system_message("documentation", system_prompt),
                 HumanMessage(content=user_prompt)
             ]
 
@@ -613,5 +838,6 @@ class STORMAgent(BaseAgent):
 
         except Exception as e:
             state["final_report"] = f"Compilation error: {str(e)}"
+            state["compile_error"] = str(e)
 
         return state
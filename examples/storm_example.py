@@ -6,31 +6,39 @@ multi-perspective reports on complex topics.
 """
 
 import os
+import sys
+from functools import lru_cache
 from dotenv import load_dotenv
 
 from agent_patterns.patterns import STORMAgent
 
 
+def _role_config(role: str, default_model: str) -> dict:
+    """Build one role's LLM config from its <ROLE>_* environment variables."""
+    prefix = role.upper()
+    return {
+        "provider": os.getenv(f"{prefix}_MODEL_PROVIDER", "openai"),
+        "model_name": os.getenv(f"{prefix}_MODEL_NAME", default_model),
+        "temperature": float(os.getenv(f"{prefix}_TEMPERATURE", "0.7")),
+    }
+
+
 def main():
     """Run the STORM agent example."""
     # Load environment variables
     load_dotenv()
 
-    # Configure LLMs
+    # Configure LLMs. Roles configured with the same provider, model and settings
+    # share a single client instance (and its connection pool) inside the agent.
     llm_configs = {
-        "thinking": {
-            "provider": os.getenv("THINKING_MODEL_PROVIDER", "openai"),
-            "model_name": os.getenv("THINKING_MODEL_NAME", "gpt-4o"),
-            "temperature": float(os.getenv("THINKING_TEMPERATURE", "0.7")),
-        },
-        "documentation": {
-            "provider": os.getenv("DOCUMENTATION_MODEL_PROVIDER", "openai"),
-            "model_name": os.getenv("DOCUMENTATION_MODEL_NAME", "gpt-4o-mini"),
-            "temperature": float(os.getenv("DOCUMENTATION_TEMPERATURE", "0.7")),
-        },
+        role: _role_config(role, default_model)
+        for role, default_model in (("thinking", "gpt-4o"), ("documentation", "gpt-4o-mini"))
     }
 
-    # Define simple retrieval tools (in production, use real APIs)
+    # Define simple retrieval tools (in production, use real APIs). The examples
+    # below cover overlapping topics, so results are memoized for the whole run;
+    # swap in a disk-backed cache to also reuse paid API results across runs.
+    @lru_cache(maxsize=1024)
     def search_tool(query: str) -> str:
         """Simulated search tool."""
         return f"[Simulated research findings for: {query}]"
@@ -53,41 +61,35 @@ def main():
     print(f"\nTask: {task1}")
     print("\nRunning agent (will generate multi-perspective report with research)...")
 
+    # Stream the report as it is written, teeing each chunk to the terminal and a file
     try:
-        result1 = agent.run(task1)
-        print(f"\nFinal Result:\n{result1}")
+        print("\nFinal Result:")
+        with open("storm_report.md", "w", encoding="utf-8") as f:
+            for chunk in agent.stream(task1):
+                sys.stdout.write(chunk)
+                sys.stdout.flush()
+                f.write(chunk)
+        print("\n\nReport saved to storm_report.md")
     except Exception as e:
         print(f"\nError: {e}")
 
     print("\nNote: If you see an error about missing API keys, make sure to create a .env file with your LLM API keys.")
 
-    # Example 2: Industry Analysis
+    # Examples 2 and 3 are independent, so run them as one batch
     print("\n" + "=" * 80)
-    print("Example 2: Industry Analysis Report")
+    print("Examples 2 and 3: Industry Analysis and Educational Content")
     print("=" * 80)
     task2 = "Analyze the impact of artificial intelligence on the healthcare industry"
-    print(f"\nTask: {task2}")
-    print("\nRunning agent...")
-
-    try:
-        result2 = agent.run(task2)
-        print(f"\nFinal Result:\n{result2}")
-    except Exception as e:
-        print(f"\nError: {e}")
-
-    # Example 3: Educational Content
-    print("\n" + "=" * 80)
-    print("Example 3: Educational Content Creation")
-    print("=" * 80)
     task3 = "Write a comprehensive guide to sustainable agriculture practices"
-    print(f"\nTask: {task3}")
-    print("\nRunning agent...")
-
-    try:
-        result3 = agent.run(task3)
-        print(f"\nFinal Result:\n{result3}")
-    except Exception as e:
-        print(f"\nError: {e}")
+    print(f"\nTask 2: {task2}")
+    print(f"Task 3: {task3}")
+    print("\nRunning agent on both tasks concurrently...")
+
+    for number, result in zip((2, 3), agent.batch_run([task2, task3]), strict=True):
+        if isinstance(result, Exception):
+            print(f"\nTask {number} Error: {result}")
+        else:
+            print(f"\nTask {number} Final Result:\n{result}")
 
     print("\n" + "=" * 80)
     print("STORM Agent Examples Complete!")
@@ -4,14 +4,24 @@ Unit tests for the BaseAgent class.
 
 import os
 import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
 import pytest
+from langchain_core.caches import InMemoryCache
 
 from agent_patterns.core import BaseAgent
 
 
+@pytest.fixture(autouse=True)
+def clear_shared_llms():
+    """Drop shared LLM instances after each test so tests stay independent."""
+    yield
+    BaseAgent._clear_shared_llms()
+
+
 # Concrete implementation for testing
 class TestAgent(BaseAgent):
     """Concrete test implementation of BaseAgent."""
@@ -40,14 +50,57 @@ def test_base_agent_initialization():
 
 
 def test_base_agent_build_graph_called():
-    """Test that build_graph is called during initialization."""
+    """Test that build_graph is called once, on first access to the graph."""
     llm_configs = {"thinking": {"provider": "openai", "model_name": "gpt-4"}}
 
     with patch.object(TestAgent, "build_graph") as mock_build:
         agent = TestAgent(llm_configs=llm_configs)
+        mock_build.assert_not_called()
+
+        first = agent.graph
+        second = agent.graph
+        assert first is second
         mock_build.assert_called_once()
 
 
+def test_graph_built_once_under_concurrent_access():
+    """Test that threads reading the graph during a slow build all get the built graph."""
+    build_calls = []
+
+    class SlowAgent(TestAgent):
+        def build_graph(self) -> None:
+            build_calls.append(1)
+            time.sleep(0.05)
+            self.graph = MagicMock()
+
+    agent = SlowAgent(llm_configs={"thinking": {"provider": "openai", "model_name": "gpt-4"}})
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        graphs = list(executor.map(lambda _: agent.graph, range(16)))
+
+    assert len(build_calls) == 1
+    assert all(graph is not None and graph is graphs[0] for graph in graphs)
+
+
+def test_graph_build_failure_is_retried():
+    """Test that a failed build does not leave the graph marked as built."""
+    attempts = []
+
+    class FlakyAgent(TestAgent):
+        def build_graph(self) -> None:
+            attempts.append(1)
+            if len(attempts) == 1:
+                raise RuntimeError("compile failed")
+            self.graph = MagicMock()
+
+    agent = FlakyAgent(llm_configs={"thinking": {"provider": "openai", "model_name": "gpt-4"}})
+
+    with pytest.raises(RuntimeError):
+        _ = agent.graph
+    assert agent.graph is not None
+    assert len(attempts) == 2
+
+
 @patch("agent_patterns.core.base_agent.ChatOpenAI")
 def test_get_llm_openai(mock_chat_openai):
     """Test _get_llm with OpenAI provider."""
@@ -74,6 +127,146 @@ def test_get_llm_openai(mock_chat_openai):
     assert llm is llm2  # Should return cached instance
 
 
+@patch("agent_patterns.core.base_agent.ChatOpenAI")
+def test_get_llm_shares_instance_for_identical_configs(mock_chat_openai):
+    """Test roles with identical settings share one LLM instance."""
+    llm_configs = {
+        "thinking": {"provider": "openai", "model_name": "gpt-4", "temperature": 0.5},
+        "planning": {"provider": "openai", "model_name": "gpt-4", "temperature": 0.5},
+        "critic": {"provider": "openai", "model_name": "gpt-4", "temperature": 0.9},
+    }
+
+    agent = TestAgent(llm_configs=llm_configs)
+
+    assert agent._get_llm("thinking") is agent._get_llm("planning")
+    agent._get_llm("critic")
+    assert mock_chat_openai.call_count == 2
+
+
+@patch("agent_patterns.core.base_agent.ChatOpenAI")
+def test_get_llm_shares_instance_across_agents(mock_chat_openai):
+    """Test separate agents with identical role settings share one LLM instance."""
+    llm_configs = {"thinking": {"provider": "openai", "model_name": "gpt-4"}}
+
+    first = TestAgent(llm_configs=llm_configs)
+    second = TestAgent(llm_configs=dict(llm_configs))
+
+    assert first._get_llm("thinking") is second._get_llm("thinking")
+    mock_chat_openai.assert_called_once()
+
+
+@patch("agent_patterns.core.base_agent.ChatOpenAI")
+def test_get_llm_concurrent_calls_create_one_instance(mock_chat_openai):
+    """Test concurrent lookups from worker threads construct a single LLM."""
+    mock_chat_openai.side_effect = lambda **kwargs: time.sleep(0.01) or MagicMock()
+    llm_configs = {"thinking": {"provider": "openai", "model_name": "gpt-4"}}
+    agents = [TestAgent(llm_configs=llm_configs) for _ in range(4)]
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        llms = list(executor.map(lambda agent: agent._get_llm("thinking"), agents))
+
+    mock_chat_openai.assert_called_once()
+    assert all(llm is llms[0] for llm in llms)
+
+
+@patch("agent_patterns.core.base_agent.ChatOpenAI")
+def test_clear_shared_llms_creates_fresh_instances(mock_chat_openai):
+    """Test clearing shared instances makes new agents build their own."""
+    mock_chat_openai.side_effect = lambda **kwargs: MagicMock()
+    llm_configs = {"thinking": {"provider": "openai", "model_name": "gpt-4"}}
+
+    first = TestAgent(llm_configs=llm_configs)._get_llm("thinking")
+    BaseAgent._clear_shared_llms()
+    second = TestAgent(llm_configs=llm_configs)._get_llm("thinking")
+
+    assert first is not second
+    assert mock_chat_openai.call_count == 2
+
+
+@patch("agent_patterns.core.base_agent.ChatOpenAI")
+def test_get_llm_passes_shared_http_client(mock_chat_openai):
+    """Test a configured http_client is handed to the OpenAI model."""
+    http_client = MagicMock()
+    llm_configs = {
+        "thinking": {"provider": "openai", "model_name": "gpt-4", "http_client": http_client},
+        "planning": {"provider": "openai", "model_name": "gpt-4o", "http_client": http_client},
+    }
+
+    agent = TestAgent(llm_configs=llm_configs)
+    agent._get_llm("thinking")
+    agent._get_llm("planning")
+
+    for call in mock_chat_openai.call_args_list:
+        assert call.kwargs["http_client"] is http_client
+
+
+@patch("agent_patterns.core.base_agent.ChatOpenAI")
+def test_get_llm_enables_shared_response_cache(mock_chat_openai):
+    """Test cache=True gives every role the same response cache."""
+    llm_configs = {
+        "thinking": {"provider": "openai", "model_name": "gpt-4", "cache": True},
+        "planning": {"provider": "openai", "model_name": "gpt-4o", "cache": True},
+    }
+
+    agent = TestAgent(llm_configs=llm_configs)
+    agent._get_llm("thinking")
+    agent._get_llm("planning")
+
+    first, second = mock_chat_openai.call_args_list
+    assert isinstance(first.kwargs["cache"], InMemoryCache)
+    assert first.kwargs["cache"] is second.kwargs["cache"]
+
+
+@patch("agent_patterns.core.base_agent.ChatOpenAI")
+def test_shared_response_cache_is_bounded_and_configurable(mock_chat_openai):
+    """Test the shared response cache has a size limit that can be changed."""
+    llm_configs = {"thinking": {"provider": "openai", "model_name": "gpt-4", "cache": True}}
+
+    TestAgent(llm_configs=llm_configs)._get_llm("thinking")
+    default_cache = mock_chat_openai.call_args.kwargs["cache"]
+
+    try:
+        BaseAgent._configure_response_cache(maxsize=10)
+        TestAgent(llm_configs=llm_configs)._get_llm("thinking")
+        resized_cache = mock_chat_openai.call_args.kwargs["cache"]
+    finally:
+        BaseAgent._configure_response_cache()
+
+    assert default_cache._maxsize == 1000
+    assert resized_cache is not default_cache
+    assert resized_cache._maxsize == 10
+    assert mock_chat_openai.call_count == 2
+
+    with pytest.raises(ValueError, match="maxsize must be at least 1"):
+        BaseAgent._configure_response_cache(maxsize=0)
+
+
+def test_get_llm_rejects_invalid_cache():
+    """Test unsupported cache values are rejected."""
+    llm_configs = {"thinking": {"provider": "openai", "model_name": "gpt-4", "cache": "sqlite"}}
+
+    agent = TestAgent(llm_configs=llm_configs)
+
+    with pytest.raises(ValueError, match="cache"):
+        agent._get_llm("thinking")
+
+
+def test_get_llm_http_client_requires_openai():
+    """Test http_client is rejected for providers that cannot use it."""
+    llm_configs = {
+        "thinking": {
+            "provider": "anthropic",
+            "model_name": "claude-3-5-sonnet-20241022",
+            "http_client": MagicMock(),
+        }
+    }
+
+    agent = TestAgent(llm_configs=llm_configs)
+
+    with pytest.raises(ValueError, match="http_client"):
+        agent._get_llm("thinking")
+
+
 @patch("agent_patterns.core.base_agent.ChatAnthropic")
 def test_get_llm_anthropic(mock_chat_anthropic):
     """Test _get_llm with Anthropic provider."""
@@ -147,6 +340,24 @@ def test_load_prompt_with_files():
         assert prompts["user"] == "User prompt template: {input}"
 
 
+def test_load_prompt_caches_files_until_invalidated():
+    """Test prompt files are read once and re-read after invalidation."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        prompt_dir = Path(tmpdir)
+        agent_dir = prompt_dir / "TestAgent" / "TestStep"
+        agent_dir.mkdir(parents=True)
+        (agent_dir / "system.md").write_text("Original")
+
+        agent = TestAgent(llm_configs={}, prompt_dir=str(prompt_dir))
+        assert agent._load_prompt("TestStep")["system"] == "Original"
+
+        (agent_dir / "system.md").write_text("Edited")
+        assert agent._load_prompt("TestStep")["system"] == "Original"
+
+        TestAgent._invalidate_prompt_cache()
+        assert agent._load_prompt("TestStep")["system"] == "Edited"
+
+
 def test_load_prompt_missing_files():
     """Test _load_prompt when files don't exist."""
     with tempfile.TemporaryDirectory() as tmpdir:
@@ -174,6 +385,25 @@ def test_load_prompt_partial_files():
         assert prompts["user"] == ""
 
 
+def test_system_message_marks_anthropic_prompt_cacheable():
+    """Test Anthropic system prompts carry an ephemeral cache breakpoint."""
+    llm_configs = {
+        "thinking": {"provider": "anthropic", "model_name": "claude-3-5-sonnet-20241022"},
+        "documentation": {"provider": "openai", "model_name": "gpt-4"},
+    }
+    agent = TestAgent(llm_configs=llm_configs)
+
+    cached = agent._system_message("thinking", "You are helpful.")
+    plain = agent._system_message("documentation", "You are helpful.")
+
+    assert cached.content == [{
+        "type": "text",
+        "text": "You are helpful.",
+        "cache_control": {"type": "ephemeral"},
+    }]
+    assert plain.content == "You are helpful."
+
+
 def test_stream_default_implementation():
     """Test default stream implementation."""
     llm_configs = {"thinking": {"provider": "openai", "model_name": "gpt-4"}}
@@ -186,6 +416,24 @@ def test_stream_default_implementation():
     assert results[0] == f"Processed: {input_data}"
 
 
+def test_batch_run_returns_results_in_order():
+    """Test batch_run runs every input and keeps input order."""
+    agent = TestAgent(llm_configs={})
+
+    assert agent.batch_run(["a", "b", "c"]) == ["Processed: a", "Processed: b", "Processed: c"]
+
+
+def test_batch_run_returns_errors_in_place():
+    """Test a failing input yields its exception without affecting the others."""
+    agent = TestAgent(llm_configs={})
+    error = RuntimeError("boom")
+
+    with patch.object(agent, "run", side_effect=["ok", error]):
+        results = agent.batch_run(["a", "b"], max_concurrency=1)
+
+    assert results == ["ok", error]
+
+
 def test_lifecycle_hooks():
     """Test lifecycle hook methods."""
     llm_configs = {"thinking": {"provider": "openai", "model_name": "gpt-4"}}
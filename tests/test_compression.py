@@ -0,0 +1,69 @@
+"""Unit tests for rule-based text compression."""
+
+import pytest
+
+from agent_patterns.core.compression import compress, estimate_tokens, fit_to_budget
+
+
+class TestCompress:
+    """Test compress() at each level."""
+
+    def test_none_returns_text_unchanged(self):
+        """Test the none level is a no-op."""
+        text = "Solar  power.\n\n\nSolar power."
+
+        assert compress(text, "none") == text
+
+    def test_low_collapses_whitespace(self):
+        """Test the low level only normalizes spacing."""
+        text = "Solar \t power  grows.\n\n\nSolar power grows."
+
+        assert compress(text, "low") == "Solar power grows.\nSolar power grows."
+
+    def test_medium_drops_repeated_sentences(self):
+        """Test repeated sentences are kept once, ignoring case and punctuation."""
+        text = "Solar power grows. Costs fall!\nsolar power grows\nWind is steady."
+
+        assert compress(text) == "Solar power grows. Costs fall!\nWind is steady."
+
+    def test_high_drops_stopwords(self):
+        """Test the high level removes common function words."""
+        assert compress("The cost of the panels is falling.", "high") == "cost panels falling."
+
+    def test_invalid_level_raises(self):
+        """Test unknown levels are rejected."""
+        with pytest.raises(ValueError, match="Unsupported compression level"):
+            compress("text", "extreme")
+
+
+class TestFitToBudget:
+    """Test fitting text into a token budget."""
+
+    def test_text_within_budget_is_unchanged(self):
+        """Test text already under budget is returned as-is."""
+        assert fit_to_budget("Short text.", 100) == ("Short text.", "none")
+
+    def test_escalates_compression_until_it_fits(self):
+        """Test the least aggressive level that fits is chosen."""
+        text = "Panels are cheap.\nPanels are cheap.\nPanels are cheap."
+
+        fitted, step = fit_to_budget(text, estimate_tokens("Panels are cheap."))
+
+        assert (fitted, step) == ("Panels are cheap.", "medium")
+
+    def test_drops_trailing_lines_when_compression_is_not_enough(self):
+        """Test later lines are dropped once every level is exhausted."""
+        text = "\n".join(f"Finding number {i} matters greatly." for i in range(20))
+
+        fitted, step = fit_to_budget(text, 20)
+
+        assert step == "truncated"
+        assert fitted.startswith("Finding number 0")
+        assert estimate_tokens(fitted) <= 20
+
+    def test_budget_below_one_raises(self):
+        """Test budgets that cannot hold any text are rejected."""
+        with pytest.raises(ValueError, match="max_tokens must be at least 1"):
+            fit_to_budget("alpha beta gamma delta epsilon zeta", -1)
+        with pytest.raises(ValueError, match="max_tokens must be at least 1"):
+            fit_to_budget("alpha beta", 0)
@@ -1,6 +1,7 @@
 """Unit tests for the LLMCompilerAgent pattern."""
 
 import os
+import threading
 from pathlib import Path
 from typing import Any, Dict
 from unittest.mock import MagicMock, Mock, patch
@@ -84,6 +85,11 @@ class TestLLMCompilerAgentInitialization:
             assert agent.tools == {}
             assert agent.graph is not None
 
+    def test_invalid_max_parallel_tools_raises(self, mock_llm_configs):
+        """Test max_parallel_tools below 1 is rejected up front."""
+        with pytest.raises(ValueError, match="max_parallel_tools must be at least 1"):
+            LLMCompilerAgent(llm_configs=mock_llm_configs, max_parallel_tools=0)
+
     def test_initialization_builds_graph(self, mock_llm_configs, sample_tools):
         """Test that initialization builds the state graph."""
         with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
@@ -345,7 +351,34 @@ class TestExecutorDispatch:
         # First dispatch - only node1 should execute
         new_state = agent._executor_dispatch(state)
         assert "node1" in new_state["node_results"]
-        # node2 shouldn't execute yet (though in our simple implementation it might)
+        assert "node2" not in new_state["node_results"]
+
+        # Second dispatch - node2 is now ready
+        new_state = agent._executor_dispatch(new_state)
+        assert "node2" in new_state["node_results"]
+
+    def test_executor_runs_ready_nodes_concurrently(self, agent):
+        """Test that independent ready nodes run at the same time."""
+        barrier = threading.Barrier(2, timeout=5)
+
+        def wait_tool(query: str) -> str:
+            barrier.wait()
+            return f"done {query}"
+
+        agent.tools["wait_tool"] = wait_tool
+        state = {
+            "execution_graph": {
+                "nodes": [
+                    {"id": "a", "tool": "wait_tool", "args": {"query": "a"}, "depends_on": []},
+                    {"id": "b", "tool": "wait_tool", "args": {"query": "b"}, "depends_on": []}
+                ]
+            },
+            "node_results": {}
+        }
+
+        new_state = agent._executor_dispatch(state)
+
+        assert new_state["node_results"] == {"a": "done a", "b": "done b"}
 
     def test_executor_handles_errors(self, agent):
         """Test that executor handles errors gracefully."""
@@ -508,6 +541,23 @@ class TestSynthesis:
         assert new_state["final_answer"] == "Synthesized final answer"
         mock_get_llm.assert_called_with("documentation")
 
+    @patch("agent_patterns.patterns.llm_compiler_agent.LLMCompilerAgent._get_llm")
+    def test_synthesize_marks_system_prompt_cacheable_for_anthropic(self, mock_get_llm, agent):
+        """Test Anthropic synthesis sends the system prompt with a cache breakpoint."""
+        agent.llm_configs["documentation"] = {"provider": "anthropic", "model": "claude-3-5-sonnet-20241022"}
+        mock_llm = Mock()
+        mock_llm.invoke.return_value = Mock(content="Synthesized final answer")
+        mock_get_llm.return_value = mock_llm
+
+        agent._synthesize_result({
+            "input_task": "Test task",
+            "execution_graph": {"nodes": []},
+            "node_results": {}
+        })
+
+        system_message = mock_llm.invoke.call_args.args[0][0]
+        assert system_message.content[0]["cache_control"] == {"type": "ephemeral"}
+
     def test_synthesize_with_error(self, agent):
         """Test synthesis when error exists."""
         state = {
@@ -63,6 +63,12 @@ def test_react_agent_initialization_no_tools(llm_configs):
     assert agent.max_iterations == 5  # default
 
 
+def test_react_agent_negative_max_history_steps_raises(llm_configs):
+    """Test that a negative max_history_steps is rejected."""
+    with pytest.raises(ValueError, match="max_history_steps must be at least 0"):
+        ReActAgent(llm_configs=llm_configs, max_history_steps=-1)
+
+
 def test_react_agent_build_graph_structure(llm_configs, tools):
     """Test that build_graph creates correct graph structure."""
     agent = ReActAgent(llm_configs=llm_configs, tools=tools)
@@ -125,6 +131,65 @@ def test_parse_llm_response_final_answer():
     assert action["tool_input"] == "The answer is 42"
 
 
+def test_parse_llm_response_case_insensitive_headers():
+    """Test section headers are matched regardless of case."""
+    agent = ReActAgent(llm_configs={}, tools={})
+
+    response = """
+    THOUGHT: Look it up
+    action: search
+    ACTION INPUT: test query
+    """
+
+    thought, action = agent._parse_llm_response(response)
+
+    assert thought == "Look it up"
+    assert action == {"tool_name": "search", "tool_input": "test query"}
+
+
+def test_parse_llm_response_unquotes_string_input():
+    """Test one pair of outer quotes is stripped from tool inputs."""
+    agent = ReActAgent(llm_configs={}, tools={})
+
+    _, double = agent._parse_llm_response('Action: search\nAction Input: "capital of France"')
+    _, single = agent._parse_llm_response("Action: search\nAction Input: 'capital of France'")
+    _, unbalanced = agent._parse_llm_response("Action: search\nAction Input: 'it's'")
+    _, concatenated = agent._parse_llm_response('Action: search\nAction Input: "a" "b"')
+
+    assert double["tool_input"] == "capital of France"
+    assert single["tool_input"] == "capital of France"
+    assert unbalanced["tool_input"] == "'it's'"
+    assert concatenated["tool_input"] == '"a" "b"'
+
+
+def test_parse_llm_response_keeps_backslashes_in_quoted_input():
+    """Test backslashes in quoted tool inputs are not decoded as escapes."""
+    agent = ReActAgent(llm_configs={}, tools={})
+
+    _, path = agent._parse_llm_response('Action: read_file\nAction Input: "C:\\new\\table"')
+    _, regex = agent._parse_llm_response("Action: grep\nAction Input: '\\d+\\s\\w+'")
+
+    assert path["tool_input"] == "C:\\new\\table"
+    assert regex["tool_input"] == "\\d+\\s\\w+"
+
+
+def test_parse_llm_response_ignores_invented_observation():
+    """Test parsing stops at an observation the LLM wrote itself."""
+    agent = ReActAgent(llm_configs={}, tools={})
+
+    response = """
+    Thought: Look it up
+    Action: search
+    Action Input: test query
+    Observation: made-up result
+    Action: Final Answer
+    """
+
+    _, action = agent._parse_llm_response(response)
+
+    assert action == {"tool_name": "search", "tool_input": "test query"}
+
+
 def test_format_history_empty():
     """Test formatting empty history."""
     agent = ReActAgent(llm_configs={}, tools={})
@@ -153,6 +218,24 @@ def test_format_history_with_steps():
     assert "calculator" in history
 
 
+def test_format_history_condenses_old_steps():
+    """Test only the most recent steps are shown in full when a window is set."""
+    agent = ReActAgent(llm_configs={}, tools={}, max_history_steps=1)
+
+    steps = [
+        ("First thought", {"tool_name": "search", "tool_input": "query1"}, "result1"),
+        ("Second thought", {"tool_name": "search", "tool_input": "query2"}, "result2"),
+        ("Third thought", {"tool_name": "calculator", "tool_input": "2+2"}, "4"),
+    ]
+
+    history = agent._format_history(steps)
+
+    assert history.startswith("Steps 1-2: (condensed) used search")
+    assert "result1" not in history
+    assert "Step 3:" in history
+    assert "Observation: 4" in history
+
+
 def test_execute_action_with_valid_tool(tools):
     """Test executing action with a valid tool."""
     agent = ReActAgent(llm_configs={}, tools=tools)
@@ -369,6 +452,77 @@ def test_list_tools(tools):
     assert len(tool_list) == 2
 
 
+def test_generate_thought_stops_before_observation(llm_configs, tools):
+    """Test the thought step asks the LLM to stop before writing an observation."""
+    agent = ReActAgent(llm_configs=llm_configs, tools=tools)
+    llm = MagicMock()
+    llm.invoke.return_value = MagicMock(content="Thought: done\nAction: Final Answer\nAction Input: 42")
+    agent._llm_cache["thinking"] = llm
+
+    state = agent._generate_thought_and_action({"input": "q", "intermediate_steps": []})
+
+    assert llm.invoke.call_args.kwargs["stop"] == ["\nObservation:"]
+    assert state["action"] == {"tool_name": "Final Answer", "tool_input": "42"}
+
+
+def test_generate_thought_without_stop_sequence(llm_configs, tools):
+    """Test the stop parameter is not sent when the stop sequence is disabled."""
+    agent = ReActAgent(llm_configs=llm_configs, tools=tools, use_stop_sequence=False)
+    llm = MagicMock()
+    llm.invoke.return_value = MagicMock(
+        content="Action: Final Answer\nAction Input: 42\nObservation: invented"
+    )
+    agent._llm_cache["thinking"] = llm
+
+    state = agent._generate_thought_and_action({"input": "q", "intermediate_steps": []})
+
+    assert "stop" not in llm.invoke.call_args.kwargs
+    assert state["action"] == {"tool_name": "Final Answer", "tool_input": "42"}
+
+
+def test_generate_thought_picks_up_prompt_override_changes(llm_configs, tools):
+    """Test prompt overrides changed between iterations are used on the next one."""
+    agent = ReActAgent(llm_configs=llm_configs, tools=tools)
+    llm = MagicMock()
+    llm.invoke.return_value = MagicMock(content="Action: Final Answer\nAction Input: 42")
+    agent._llm_cache["thinking"] = llm
+
+    agent._generate_thought_and_action({"input": "q", "intermediate_steps": []})
+    agent.prompt_overrides = {"ThoughtStep": {"system": "Think like a scientist"}}
+    agent._generate_thought_and_action({"input": "q", "intermediate_steps": []})
+
+    system_message = llm.invoke.call_args.args[0][0]
+    assert "Think like a scientist" in system_message.content
+
+
+def test_generate_thought_marks_system_prompt_cacheable_for_anthropic(tools):
+    """Test Anthropic thought steps send the system prompt with a cache breakpoint."""
+    agent = ReActAgent(
+        llm_configs={"thinking": {"provider": "anthropic", "model_name": "claude-3-5-sonnet-20241022"}},
+        tools=tools,
+    )
+    llm = MagicMock()
+    llm.invoke.return_value = MagicMock(content="Action: Final Answer\nAction Input: 42")
+    agent._llm_cache["thinking"] = llm
+
+    agent._generate_thought_and_action({"input": "q", "intermediate_steps": []})
+
+    system_message = llm.invoke.call_args.args[0][0]
+    assert system_message.content[0]["cache_control"] == {"type": "ephemeral"}
+
+
+def test_format_tools_refreshes_after_tool_changes(llm_configs, tools):
+    """Test the cached tool list follows add_tool and remove_tool."""
+    agent = ReActAgent(llm_configs=llm_configs, tools=dict(tools))
+    original = agent._format_tools()
+
+    agent.add_tool("new_tool", lambda x: x)
+    assert agent._format_tools() == original + ", new_tool"
+
+    agent.remove_tool("new_tool")
+    assert agent._format_tools() == original
+
+
 def test_run_requires_built_graph(llm_configs, tools):
     """Test that run raises error if graph not built."""
     agent = ReActAgent(llm_configs=llm_configs, tools=tools)
@@ -144,7 +144,7 @@ def test_check_cycle_limit_exceeded():
     assert result_state["continue_reflection"] is False
 
 
-@patch("agent_patterns.patterns.reflection_agent.SystemMessage")
+@patch.object(ReflectionAgent, "_system_message")
 @patch("agent_patterns.patterns.reflection_agent.HumanMessage")
 @patch.object(ReflectionAgent, "_get_llm")
 @patch.object(ReflectionAgent, "_load_prompt")
@@ -173,7 +173,7 @@ def test_generate_initial_output(mock_load, mock_get_llm, mock_human, mock_syste
     mock_load.assert_called_with("Generate")
 
 
-@patch("agent_patterns.patterns.reflection_agent.SystemMessage")
+@patch.object(ReflectionAgent, "_system_message")
 @patch("agent_patterns.patterns.reflection_agent.HumanMessage")
 @patch.object(ReflectionAgent, "_get_llm")
 @patch.object(ReflectionAgent, "_load_prompt")
@@ -207,7 +207,7 @@ def test_reflect_on_output(mock_load, mock_get_llm, mock_human, mock_system, llm
     mock_load.assert_called_with("Reflect")
 
 
-@patch("agent_patterns.patterns.reflection_agent.SystemMessage")
+@patch.object(ReflectionAgent, "_system_message")
 @patch("agent_patterns.patterns.reflection_agent.HumanMessage")
 @patch.object(ReflectionAgent, "_get_llm")
 @patch.object(ReflectionAgent, "_load_prompt")
@@ -241,7 +241,7 @@ def test_reflect_on_refined_output(mock_load, mock_get_llm, mock_human, mock_sys
     assert result_state["reflection_cycle"] == 2
 
 
-@patch("agent_patterns.patterns.reflection_agent.SystemMessage")
+@patch.object(ReflectionAgent, "_system_message")
 @patch("agent_patterns.patterns.reflection_agent.HumanMessage")
 @patch.object(ReflectionAgent, "_get_llm")
 @patch.object(ReflectionAgent, "_load_prompt")
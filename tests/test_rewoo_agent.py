@@ -1,6 +1,7 @@
 """Unit tests for the REWOOAgent pattern."""
 
 import os
+import threading
 from pathlib import Path
 from typing import Any, Dict
 from unittest.mock import MagicMock, Mock, patch
@@ -85,6 +86,11 @@ class TestREWOOAgentInitialization:
             assert agent.tools == {}
             assert agent.graph is not None
 
+    def test_invalid_max_parallel_tools_raises(self, mock_llm_configs):
+        """Test max_parallel_tools below 1 is rejected up front."""
+        with pytest.raises(ValueError, match="max_parallel_tools must be at least 1"):
+            REWOOAgent(llm_configs=mock_llm_configs, max_parallel_tools=0)
+
     def test_initialization_custom_solver_role(self, mock_llm_configs, sample_tools):
         """Test agent initializes with custom solver LLM role."""
         with patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"}):
@@ -108,6 +114,62 @@ class TestREWOOAgentInitialization:
             assert hasattr(agent.graph, 'invoke')
 
 
+class TestPlanCache:
+    """Test reuse of Worker plans for repeated tasks."""
+
+    PLAN = """PLAN: Search -> {info}
+
+SOLVER: info
+TOOL: search_tool
+PARAMS: {"query": "test"}"""
+
+    @patch("agent_patterns.patterns.rewoo_agent.REWOOAgent._get_llm")
+    def test_repeated_task_reuses_plan(self, mock_get_llm, mock_llm_configs, sample_tools):
+        """Test the Worker is called once for tasks that match after normalization."""
+        agent = REWOOAgent(llm_configs=mock_llm_configs, tools=sample_tools, cache_plans=True)
+        mock_llm = Mock()
+        mock_llm.invoke.return_value = Mock(content=self.PLAN)
+        mock_get_llm.return_value = mock_llm
+
+        first = agent._worker_plan({"input_task": "Find info"})
+        first["solver_requests"][0]["params"]["query"] = "mutated"
+        second = agent._worker_plan({"input_task": "  find   INFO "})
+
+        mock_llm.invoke.assert_called_once()
+        assert second["worker_plan_template"] == "Search -> {info}"
+        assert second["solver_requests"][0]["params"] == {"query": "test"}
+
+    @patch("agent_patterns.patterns.rewoo_agent.REWOOAgent._get_llm")
+    def test_plans_not_cached_by_default(self, mock_get_llm, agent):
+        """Test every run re-plans unless caching is enabled."""
+        mock_llm = Mock()
+        mock_llm.invoke.return_value = Mock(content=self.PLAN)
+        mock_get_llm.return_value = mock_llm
+
+        agent._worker_plan({"input_task": "Find info"})
+        agent._worker_plan({"input_task": "Find info"})
+
+        assert mock_llm.invoke.call_count == 2
+
+    @patch("agent_patterns.patterns.rewoo_agent.REWOOAgent._get_llm")
+    def test_fallback_plan_not_cached(self, mock_get_llm, mock_llm_configs, sample_tools):
+        """Test a response without a parseable plan is not reused for later runs."""
+        agent = REWOOAgent(llm_configs=mock_llm_configs, tools=sample_tools, cache_plans=True)
+        mock_llm = Mock()
+        mock_llm.invoke.side_effect = [
+            Mock(content="I can't help with that."),
+            Mock(content=self.PLAN),
+        ]
+        mock_get_llm.return_value = mock_llm
+
+        first = agent._worker_plan({"input_task": "Find info"})
+        second = agent._worker_plan({"input_task": "Find info"})
+
+        assert first["worker_plan_template"].startswith("Execute task:")
+        assert second["worker_plan_template"] == "Search -> {info}"
+        assert mock_llm.invoke.call_count == 2
+
+
 class TestToolFormatting:
     """Test tool formatting for prompts."""
 
@@ -196,6 +258,23 @@ TOOL: search_tool
         # Should handle missing PARAMS gracefully
         assert len(requests) >= 0
 
+    def test_parse_plan_with_invalid_params_keeps_raw(self, agent):
+        """Test PARAMS that are not valid JSON are kept as raw text."""
+        plan_text = """
+PLAN: Do something -> {result1}
+Some commentary: ignored
+SOLVER: result1
+TOOL: search_tool
+PARAMS: query=test
+"""
+
+        template, requests = agent._parse_worker_plan(plan_text)
+
+        assert template == "Do something -> {result1}"
+        assert requests == [
+            {"placeholder": "result1", "tool": "search_tool", "params": {"raw": "query=test"}}
+        ]
+
 
 class TestParameterResolution:
     """Test parameter placeholder resolution."""
@@ -240,6 +319,15 @@ class TestParameterResolution:
         # Should keep unresolv placeholder
         assert "{nonexistent}" in resolved["query"]
 
+    def test_resolve_does_not_rescan_substituted_results(self, agent):
+        """Test that placeholders inside a result are not substituted again."""
+        params = {"query": "{first} then {second}"}
+        solver_results = {"first": "{second}", "second": "done"}
+
+        resolved = agent._resolve_params(params, solver_results)
+
+        assert resolved["query"] == "{second} then done"
+
     def test_resolve_non_string_params(self, agent):
         """Test that non-string parameters pass through unchanged."""
         params = {"number": 42, "flag": True, "list": [1, 2, 3]}
@@ -394,6 +482,88 @@ class TestSolverExecuteStep:
         # The second query should have resolved the placeholder
         assert "info" in new_state["solver_results"]
 
+    def test_solver_execute_runs_independent_requests_concurrently(self, agent):
+        """Test that requests without dependencies run at the same time."""
+        barrier = threading.Barrier(2, timeout=5)
+
+        def wait_tool(query: str) -> str:
+            barrier.wait()
+            return f"done {query}"
+
+        agent.tools["wait_tool"] = wait_tool
+        state = {
+            "solver_requests": [
+                {"placeholder": "a", "tool": "wait_tool", "params": {"query": "a"}},
+                {"placeholder": "b", "tool": "wait_tool", "params": {"query": "b"}}
+            ],
+            "solver_results": {}
+        }
+
+        new_state = agent._solver_execute(state)
+
+        assert new_state["solver_results"] == {"a": "done a", "b": "done b"}
+
+    def test_solver_execute_waits_for_later_dependency(self, agent):
+        """Test that a request waits for a placeholder produced later in the plan."""
+        calls = []
+
+        def echo_tool(query: str) -> str:
+            calls.append(query)
+            return query.upper()
+
+        agent.tools["echo_tool"] = echo_tool
+        state = {
+            "solver_requests": [
+                {"placeholder": "info", "tool": "echo_tool", "params": {"query": "about {name}"}},
+                {"placeholder": "name", "tool": "echo_tool", "params": {"query": "ceo"}}
+            ],
+            "solver_results": {}
+        }
+
+        new_state = agent._solver_execute(state)
+
+        assert calls == ["ceo", "about CEO"]
+        assert new_state["solver_results"]["info"] == "ABOUT CEO"
+
+    def test_solver_execute_deduplicates_identical_calls(self, agent):
+        """Test that identical tool calls in a run execute once."""
+        calls = []
+
+        def echo_tool(query: str) -> str:
+            calls.append(query)
+            return query.upper()
+
+        agent.tools["echo_tool"] = echo_tool
+        state = {
+            "solver_requests": [
+                {"placeholder": "a", "tool": "echo_tool", "params": {"query": "ceo"}},
+                {"placeholder": "b", "tool": "echo_tool", "params": {"query": "ceo"}},
+                {"placeholder": "c", "tool": "echo_tool", "params": {"query": "{a}"}},
+                {"placeholder": "d", "tool": "echo_tool", "params": {"query": "CEO"}}
+            ],
+            "solver_results": {}
+        }
+
+        new_state = agent._solver_execute(state)
+
+        assert sorted(calls) == ["CEO", "ceo"]
+        assert new_state["solver_results"] == {"a": "CEO", "b": "CEO", "c": "CEO", "d": "CEO"}
+
+    def test_solver_execute_circular_dependency(self, agent):
+        """Test that circular references fall back to plan order."""
+        state = {
+            "solver_requests": [
+                {"placeholder": "a", "tool": "search_tool", "params": {"query": "{b}"}},
+                {"placeholder": "b", "tool": "search_tool", "params": {"query": "{a}"}}
+            ],
+            "solver_results": {}
+        }
+
+        new_state = agent._solver_execute(state)
+
+        assert set(new_state["solver_results"]) == {"a", "b"}
+        assert new_state.get("error") is None
+
     def test_solver_execute_with_error(self, agent):
         """Test solver execute when error exists."""
         state = {
@@ -515,6 +685,24 @@ class TestWorkerIntegration:
         assert new_state["final_answer"] == "Final integrated answer"
         assert "John Doe" in str(mock_llm.invoke.call_args)
 
+    @patch("agent_patterns.patterns.rewoo_agent.REWOOAgent._get_llm")
+    def test_worker_plan_marks_system_prompt_cacheable_for_anthropic(
+        self, mock_get_llm, sample_tools
+    ):
+        """Test Anthropic worker calls send the system prompt with a cache breakpoint."""
+        agent = REWOOAgent(
+            llm_configs={"thinking": {"provider": "anthropic", "model_name": "claude-3-5-sonnet-20241022"}},
+            tools=sample_tools
+        )
+        mock_llm = Mock()
+        mock_llm.invoke.return_value = Mock(content="PLAN: Search -> {info}")
+        mock_get_llm.return_value = mock_llm
+
+        agent._worker_plan({"input_task": "Test task"})
+
+        system_message = mock_llm.invoke.call_args.args[0][0]
+        assert system_message.content[0]["cache_control"] == {"type": "ephemeral"}
+
     def test_worker_integrate_with_error(self, agent):
         """Test worker integration when error exists."""
         state = {
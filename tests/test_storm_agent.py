@@ -0,0 +1,412 @@
+"""Unit tests for the STORMAgent pattern."""
+
+import re
+import threading
+from typing import List, Tuple
+from unittest.mock import MagicMock, patch
+
+import pytest
+from langchain_core.language_models import SimpleChatModel
+from langchain_core.messages import AIMessageChunk
+from langchain_core.outputs import ChatGenerationChunk
+
+from agent_patterns.patterns.storm_agent import STORMAgent
+
+OUTLINE_RESPONSE = """SECTION: Introduction
+SUBSECTION: Background
+
+SECTION: Applications
+SUBSECTION: Industry"""
+
+PERSPECTIVES_RESPONSE = """PERSPECTIVE: expert
+PERSPECTIVE: critic"""
+
+QUESTIONS_RESPONSE = """1. What is the history?
+2. What are the main uses?"""
+
+
+@pytest.fixture
+def llm_configs():
+    """Provide LLM configurations for STORM roles."""
+    return {
+        "thinking": {"provider": "openai", "model_name": "gpt-4o"},
+        "documentation": {"provider": "openai", "model_name": "gpt-4o-mini"},
+    }
+
+
+@pytest.fixture
+def search_tool():
+    """Provide a simple retrieval tool."""
+    def search(query: str) -> str:
+        """Simulated search."""
+        return f"Findings for: {query}"
+
+    return MagicMock(side_effect=search)
+
+
+class RoutedChatModel(SimpleChatModel):
+    """Fake chat model that answers based on markers found in the prompt."""
+
+    routes: List[Tuple[str, str]]
+    default: str = ""
+
+    @property
+    def _llm_type(self) -> str:
+        return "routed-fake-chat-model"
+
+    def _call(self, messages, stop=None, run_manager=None, **kwargs) -> str:
+        prompt = messages[-1].content
+        for marker, response in self.routes:
+            if marker in prompt:
+                return response
+        return self.default
+
+    def _stream(self, messages, stop=None, run_manager=None, **kwargs):
+        response = self._call(messages, stop=stop, **kwargs)
+        for token in re.split(r"(\s+)", response):
+            if token:
+                yield ChatGenerationChunk(message=AIMessageChunk(content=token))
+
+
+class FailingCompileChatModel(RoutedChatModel):
+    """Fake chat model whose report compilation fails after the first chunk."""
+
+    def _stream(self, messages, stop=None, run_manager=None, **kwargs):
+        if "Report Compilation" not in messages[-1].content:
+            yield from super()._stream(messages, stop=stop, run_manager=run_manager, **kwargs)
+            return
+        yield ChatGenerationChunk(message=AIMessageChunk(content="Partial "))
+        raise ConnectionError("connection reset")
+
+
+@pytest.fixture
+def thinking_llm():
+    """Provide a fake LLM for the planning steps."""
+    return RoutedChatModel(
+        routes=[
+            ("Your Assigned Perspective", QUESTIONS_RESPONSE),
+            ("Available Perspectives", PERSPECTIVES_RESPONSE),
+        ],
+        default=OUTLINE_RESPONSE,
+    )
+
+
+@pytest.fixture
+def documentation_llm():
+    """Provide a fake LLM for the writing steps."""
+    return RoutedChatModel(
+        routes=[("Report Compilation", "Final report text")],
+        default="Section body",
+    )
+
+
+@pytest.fixture
+def agent(llm_configs, search_tool, thinking_llm, documentation_llm):
+    """Create a STORMAgent with fake thinking and documentation LLMs."""
+    agent = STORMAgent(llm_configs=llm_configs, retrieval_tools={"search": search_tool})
+    agent._llm_cache = {"thinking": thinking_llm, "documentation": documentation_llm}
+    return agent
+
+
+class TestSTORMAgentInitialization:
+    """Test STORMAgent initialization."""
+
+    def test_initialization_defaults(self, llm_configs):
+        """Test agent initializes with default perspectives and no tools."""
+        agent = STORMAgent(llm_configs=llm_configs)
+
+        assert agent.retrieval_tools == {}
+        assert len(agent.perspectives) == 4
+        assert agent.graph is not None
+
+    def test_invalid_compression_level_raises(self, llm_configs):
+        """Test unsupported compression levels are rejected up front."""
+        with pytest.raises(ValueError, match="Unsupported compression level"):
+            STORMAgent(llm_configs=llm_configs, compression_level="extreme")
+
+    def test_invalid_max_concurrency_raises(self, llm_configs):
+        """Test max_concurrency below 1 is rejected up front."""
+        with pytest.raises(ValueError, match="max_concurrency must be at least 1"):
+            STORMAgent(llm_configs=llm_configs, max_concurrency=0)
+
+    def test_invalid_max_synthesis_tokens_raises(self, llm_configs):
+        """Test a synthesis token budget below 1 is rejected up front."""
+        with pytest.raises(ValueError, match="max_synthesis_tokens must be at least 1"):
+            STORMAgent(llm_configs=llm_configs, max_synthesis_tokens=0)
+
+
+class TestParsing:
+    """Test STORM output parsers."""
+
+    def test_parse_outline(self, agent):
+        """Test parsing sections and subsections."""
+        outline = agent._parse_outline(OUTLINE_RESPONSE)
+
+        assert outline == {"Introduction": ["Background"], "Applications": ["Industry"]}
+
+    def test_parse_questions_limits_to_five(self, agent):
+        """Test question parsing strips numbering and caps the list."""
+        text = "\n".join(f"{i}. Why does item {i} matter?" for i in range(1, 8))
+
+        questions = agent._parse_questions(text)
+
+        assert questions[0] == "Why does item 1 matter?"
+        assert len(questions) == 5
+
+
+class TestQuestionGeneration:
+    """Test per-perspective question generation."""
+
+    def test_generate_questions_covers_all_pairs(self, agent):
+        """Test questions are parsed for every section/perspective pair."""
+        state = {
+            "topic": "Renewable energy",
+            "outline": {"Introduction": ["Background"], "Applications": []},
+            "active_perspectives": agent.perspectives[:2],
+        }
+
+        result = agent._generate_questions(state)
+
+        assert set(result["questions"]) == {"Introduction", "Applications"}
+        assert result["questions"]["Applications"]["practitioner"] == [
+            "What is the history?",
+            "What are the main uses?",
+        ]
+
+    def test_generate_questions_uses_single_batch(self, agent):
+        """Test all prompts go out in one batch bounded by max_concurrency."""
+        question_llm = MagicMock()
+        question_llm.batch.return_value = [MagicMock(content=QUESTIONS_RESPONSE)] * 4
+        agent._llm_cache["thinking"] = question_llm
+        state = {
+            "topic": "Renewable energy",
+            "outline": {"Introduction": [], "Applications": []},
+            "active_perspectives": agent.perspectives[:2],
+        }
+
+        agent._generate_questions(state)
+
+        question_llm.batch.assert_called_once()
+        question_llm.invoke.assert_not_called()
+        assert len(question_llm.batch.call_args.args[0]) == 4
+        assert question_llm.batch.call_args.kwargs["config"] == {"max_concurrency": 4}
+
+    def test_generate_questions_uses_fast_role_when_configured(self, agent):
+        """Test question generation moves to the fast role once it is configured."""
+        fast_llm = MagicMock()
+        fast_llm.batch.return_value = [MagicMock(content=QUESTIONS_RESPONSE)]
+        agent.llm_configs["fast"] = {"provider": "openai", "model_name": "gpt-4o-mini"}
+        agent._llm_cache["fast"] = fast_llm
+        state = {
+            "topic": "Renewable energy",
+            "outline": {"Introduction": []},
+            "active_perspectives": agent.perspectives[:1],
+        }
+
+        result = agent._generate_questions(state)
+
+        fast_llm.batch.assert_called_once()
+        assert result["questions"]["Introduction"]["expert"] == [
+            "What is the history?",
+            "What are the main uses?",
+        ]
+
+    def test_generate_questions_error_sets_state(self, agent):
+        """Test LLM failures are recorded on the state."""
+        agent._llm_cache["thinking"] = MagicMock()
+        agent._llm_cache["thinking"].batch.side_effect = RuntimeError("rate limited")
+        state = {
+            "topic": "Renewable energy",
+            "outline": {"Introduction": []},
+            "active_perspectives": agent.perspectives[:1],
+        }
+
+        result = agent._generate_questions(state)
+
+        assert "Question generation error" in result["error"]
+
+
+class TestSearch:
+    """Test retrieval execution."""
+
+    def test_execute_search_groups_results(self, agent, search_tool):
+        """Test results are grouped by section and perspective in query order."""
+        state = {
+            "queries": [
+                {"section": "Intro", "perspective": "expert", "question": "Q1"},
+                {"section": "Intro", "perspective": "expert", "question": "Q2"},
+                {"section": "Uses", "perspective": "critic", "question": "Q3"},
+            ]
+        }
+
+        result = agent._execute_search(state)
+
+        assert search_tool.call_count == 3
+        assert result["search_results"] == {
+            "Intro": {"expert": [
+                {"question": "Q1", "information": "Findings for: Q1"},
+                {"question": "Q2", "information": "Findings for: Q2"},
+            ]},
+            "Uses": {"critic": [{"question": "Q3", "information": "Findings for: Q3"}]},
+        }
+
+    def test_execute_search_deduplicates_questions(self, agent, search_tool):
+        """Test questions repeated across perspectives are retrieved once."""
+        state = {
+            "queries": [
+                {"section": "Intro", "perspective": "expert", "question": "What is it?"},
+                {"section": "Intro", "perspective": "critic", "question": "  what is  IT?"},
+            ]
+        }
+
+        result = agent._execute_search(state)
+
+        search_tool.assert_called_once_with("What is it?")
+        assert result["search_results"]["Intro"]["critic"] == [
+            {"question": "  what is  IT?", "information": "Findings for: What is it?"}
+        ]
+
+    def test_execute_search_runs_tools_concurrently(self, agent):
+        """Test independent retrieval calls overlap instead of running serially."""
+        barrier = threading.Barrier(3, timeout=5)
+
+        def search(query: str) -> str:
+            barrier.wait()
+            return query
+
+        agent.retrieval_tools = {"search": search}
+        state = {
+            "queries": [
+                {"section": "Intro", "perspective": "expert", "question": f"Q{i}"}
+                for i in range(3)
+            ]
+        }
+
+        result = agent._execute_search(state)
+
+        # The barrier only releases if all three calls are in flight together
+        assert [r["information"] for r in result["search_results"]["Intro"]["expert"]] == [
+            "Q0", "Q1", "Q2"
+        ]
+
+    def test_retrieved_text_is_compressed(self, llm_configs):
+        """Test tool output is compressed before it is stored."""
+        agent = STORMAgent(
+            llm_configs=llm_configs,
+            retrieval_tools={"search": lambda q: "Panels are cheap.  Panels are cheap."},
+            compression_level="medium"
+        )
+
+        assert agent._retrieve_information("solar") == "Panels are cheap."
+
+
+class TestSynthesis:
+    """Test section synthesis."""
+
+    def test_synthesize_sections_batches_sections(self, agent):
+        """Test every section is synthesized through one batch call."""
+        synthesis_llm = MagicMock()
+        synthesis_llm.batch.return_value = [MagicMock(content="Intro"), MagicMock(content="Apps")]
+        agent._llm_cache["documentation"] = synthesis_llm
+        state = {
+            "topic": "Renewable energy",
+            "search_results": {
+                "Introduction": {"expert": [{"question": "Q1", "information": "A1"}]},
+                "Applications": {"critic": [{"question": "Q2", "information": "A2"}]},
+            },
+        }
+
+        result = agent._synthesize_sections(state)
+
+        synthesis_llm.batch.assert_called_once()
+        assert result["synthesized_sections"] == {"Introduction": "Intro", "Applications": "Apps"}
+        first_prompt = synthesis_llm.batch.call_args.args[0][0][1].content
+        assert "[expert] A1" in first_prompt
+
+    def test_synthesize_sections_applies_token_budget(self, agent):
+        """Test oversized research is fitted to the budget before synthesis."""
+        synthesis_llm = MagicMock()
+        synthesis_llm.batch.return_value = [MagicMock(content="Intro")]
+        agent._llm_cache["documentation"] = synthesis_llm
+        agent.max_synthesis_tokens = 50
+        results = [{"question": f"Q{i}", "information": f"Finding {i} " * 20} for i in range(10)]
+        state = {
+            "topic": "Renewable energy",
+            "search_results": {"Introduction": {"expert": results}},
+        }
+
+        result = agent._synthesize_sections(state)
+
+        assert result["synthesis_compression"] == {"Introduction": "truncated"}
+        prompt = synthesis_llm.batch.call_args.args[0][0][1].content
+        assert "Finding 0" in prompt
+        assert "Finding 9" not in prompt
+
+
+class TestStreaming:
+    """Test streaming the final report."""
+
+    def test_stream_yields_report_chunks(self, agent):
+        """Test stream yields the compiled report incrementally."""
+        chunks = list(agent.stream("Renewable energy"))
+
+        assert len(chunks) > 1
+        assert "".join(chunks) == "Final report text"
+
+    def test_stream_raises_on_error(self, agent):
+        """Test stream surfaces workflow errors like run does."""
+        agent._llm_cache["thinking"] = MagicMock()
+        agent._llm_cache["thinking"].invoke.side_effect = RuntimeError("boom")
+
+        with pytest.raises(Exception, match="Outline generation error"):
+            list(agent.stream("Renewable energy"))
+
+    def test_stream_raises_when_compilation_fails_mid_stream(self, agent):
+        """Test a compilation failure after some chunks were yielded still raises."""
+        agent._llm_cache["documentation"] = FailingCompileChatModel(
+            routes=[], default="Section body"
+        )
+
+        chunks = []
+        with patch.object(agent, "on_finish") as on_finish, \
+                patch.object(agent, "on_error") as on_error, \
+                pytest.raises(Exception, match="Compilation error: connection reset"):
+            for chunk in agent.stream("Renewable energy"):
+                chunks.append(chunk)
+
+        assert chunks == ["Partial "]
+        on_finish.assert_not_called()
+        on_error.assert_called_once()
+
+    def test_stream_calls_lifecycle_hooks(self, agent):
+        """Test stream invokes on_start and on_finish."""
+        with patch.object(agent, "on_start") as on_start, \
+                patch.object(agent, "on_finish") as on_finish:
+            list(agent.stream("Renewable energy"))
+
+        on_start.assert_called_once_with("Renewable energy")
+        on_finish.assert_called_once_with("Final report text")
+
+
+class TestBatchRun:
+    """Test running several topics at once."""
+
+    def test_batch_run_returns_report_per_task(self, agent):
+        """Test each task gets its own report, in order."""
+        with patch.object(agent, "on_finish") as on_finish:
+            results = agent.batch_run(["Solar power", "Wind power"])
+
+        assert results == ["Final report text", "Final report text"]
+        assert on_finish.call_count == 2
+
+    def test_batch_run_returns_errors_in_place(self, agent):
+        """Test a failed task yields its exception without stopping the others."""
+        agent._llm_cache["thinking"] = MagicMock()
+        agent._llm_cache["thinking"].invoke.side_effect = RuntimeError("boom")
+
+        with patch.object(agent, "on_error") as on_error:
+            results = agent.batch_run(["Solar power"])
+
+        assert isinstance(results[0], Exception)
+        assert "Outline generation error" in str(results[0])
+        on_error.assert_called_once_with(results[0])